@@ -2,7 +2,8 @@
 """Extract LLM classifications from vtk-python-docs.jsonl to a cache file.
 
 This script reads the existing JSONL output and extracts the LLM-computed fields
-(synopsis, action_phrase, visibility_score) into a separate cache file.
+(synopsis, action_phrase, visibility_score) into a separate cache file, along
+with the hash of the class doc they were computed from.
 
 Usage:
     python scripts/extract_llm_cache.py
@@ -11,6 +12,8 @@ Usage:
 import json
 from pathlib import Path
 
+from vtk_python_docs.extract.llm import doc_hash
+
 
 def main():
     project_root = Path(__file__).parent.parent
@@ -39,6 +42,7 @@ def main():
             if synopsis or action_phrase:
                 cache_records.append({
                     "class_name": class_name,
+                    "doc_hash": doc_hash(class_name, record.get("class_doc", "")),
                     "synopsis": synopsis,
                     "action_phrase": action_phrase,
                     "visibility_score": visibility_score,
@@ -3,7 +3,7 @@
 import inspect
 from pathlib import Path
 
-from vtk_python_docs.build import build_all
+from vtk_python_docs.build import _group_by_module, build_all
 from vtk_python_docs.config import Config
 
 
@@ -28,3 +28,52 @@ class TestBuildAll:
         assert "config" in sig.parameters
         assert "clean_first" in sig.parameters
         assert sig.parameters["clean_first"].default is True
+
+
+class TestOfficialStubsInBackground:
+    """Tests for generating the official stubs alongside extraction."""
+
+    def _fail_extraction(self, monkeypatch, vtk_changed: bool) -> list:
+        from vtk_python_docs import build
+
+        calls = []
+
+        def fake_generate(cancel):
+            # Only returns once the build cancels it
+            calls.append(cancel.wait(timeout=5))
+            return None
+
+        def fail_extract(config, max_workers=None):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(build, "generate_official_stubs", fake_generate)
+        monkeypatch.setattr(build, "vtk_version_changed", lambda output_dir: vtk_changed)
+        monkeypatch.setattr(build, "extract_all", fail_extract)
+        return calls
+
+    def test_failed_extraction_cancels_generation(self, tmp_path: Path, monkeypatch):
+        """Test that a failed build cancels the background stub generation."""
+        calls = self._fail_extraction(monkeypatch, vtk_changed=True)
+        assert build_all(Config(project_root=tmp_path), clean_first=False) is False
+        assert calls == [True]
+
+    def test_skipped_when_vtk_unchanged(self, tmp_path: Path, monkeypatch):
+        """Test that stubs built for the installed VTK don't start a background generation."""
+        calls = self._fail_extraction(monkeypatch, vtk_changed=False)
+        assert build_all(Config(project_root=tmp_path), clean_first=False) is False
+        assert calls == []
+
+
+class TestGroupByModule:
+    """Tests for _group_by_module function."""
+
+    def test_groups_records(self):
+        """Test that records are grouped by module and class."""
+        records = [
+            {"class_name": "vtkA", "module_name": "vtkCore"},
+            {"class_name": "vtkB", "module_name": "vtkCore"},
+            {"class_name": "vtkC", "module_name": "vtkRendering"},
+        ]
+        result = _group_by_module(records)
+        assert list(result) == ["vtkCore", "vtkRendering"]
+        assert result["vtkCore"]["vtkB"] is records[1]
@@ -57,10 +57,13 @@ class TestConfig:
         test_file = config.enhanced_stubs_dir / "test.pyi"
         test_file.write_text("# test")
 
+        config.extract_cache.write_text("{}")
+
         config.clean()
 
         assert not config.enhanced_stubs_dir.exists()
         assert not config.markdown_dir.exists()
+        assert not config.extract_cache.exists()
 
 
 class TestGetConfig:
@@ -3,11 +3,20 @@
 Tests the public API extract_all() and internal helpers via their renamed _prefixed names.
 """
 
+import json
+from pathlib import Path
+
+from vtk_python_docs.config import Config
 from vtk_python_docs.extract.extractor import (
     _clean_docstring,
+    _extract_all_class_docs,
     _extract_methods_from_section,
     _get_vtk_classes,
+    _load_cached_records,
+    _module_cache_key,
     _parse_help_structure,
+    _write_cache_keys,
+    _write_jsonl,
 )
 
 
@@ -78,6 +87,38 @@ class vtkTest(vtkObject)
         result = _parse_help_structure(help_text, "vtkTest")
         assert "class_doc" in result
 
+    def test_splits_sections_and_methods(self):
+        """Test that each section keeps its own methods and docs."""
+        help_text = """Help on class vtkTest:
+
+class vtkTest(vtkObject)
+ |  vtkTest - A test class.
+ |
+ |  Method resolution order:
+ |      vtkTest
+ |
+ |  Methods defined here:
+ |
+ |  GetValue(self) -> int
+ |      Get the value.
+ |      C++: virtual int GetValue()
+ |
+ |  SetValue(self, value:int) -> None
+ |      Set the value.
+ |
+ |  ----------------------------------------------------------------------
+ |  Methods inherited from vtkObject:
+ |
+ |  Modified(self) -> None
+ |      Update the modification time.
+"""
+        result = _parse_help_structure(help_text, "vtkTest")
+        assert result["class_doc"] == "vtkTest - A test class."
+        assert list(result["sections"]) == ["|  Methods defined here:", "|  Methods inherited from vtkObject:"]
+        methods = result["sections"]["|  Methods defined here:"]["methods"]
+        assert list(methods) == ["GetValue", "SetValue"]
+        assert methods["GetValue"] == "GetValue(self) -> int\nGet the value."
+
 
 class TestGetVTKClasses:
     """Tests for _get_vtk_classes function."""
@@ -108,3 +149,124 @@ class TestGetVTKClasses:
         for module_name, classes in list(result.items())[:3]:
             for full_module, class_name in classes[:5]:
                 assert class_name.startswith("vtk")
+
+    def test_classes_listed_once(self):
+        """Test that no class is listed under more than one module."""
+        result = _get_vtk_classes()
+        class_names = [class_name for classes in result.values() for _, class_name in classes]
+        assert len(class_names) == len(set(class_names))
+
+    def test_sorted_order(self):
+        """Test that modules and classes are in canonical sorted order."""
+        result = _get_vtk_classes()
+        assert list(result) == sorted(result)
+        for classes in result.values():
+            class_names = [class_name for _, class_name in classes]
+            assert class_names == sorted(class_names)
+
+
+class TestExtractAllClassDocs:
+    """Tests for _extract_all_class_docs function."""
+
+    def test_extracts_in_canonical_order(self):
+        """Test that records come back in discovery order from worker processes."""
+        module_classes = {
+            "vtkCommonCore": [("vtkmodules.vtkCommonCore", "vtkObject"), ("vtkmodules.vtkCommonCore", "vtkPoints")],
+            "vtkCommonMath": [("vtkmodules.vtkCommonMath", "vtkMatrix3x3")],
+        }
+        records = _extract_all_class_docs(module_classes, max_workers=2)
+        assert [r["class_name"] for r in records] == ["vtkObject", "vtkPoints", "vtkMatrix3x3"]
+        assert [r["module_name"] for r in records] == ["vtkCommonCore", "vtkCommonCore", "vtkCommonMath"]
+        assert "role" in records[0]
+
+    def test_reuses_cached_modules(self):
+        """Test that cached modules are not re-extracted."""
+        module_classes = {
+            "vtkCommonCore": [("vtkmodules.vtkCommonCore", "vtkObject")],
+            "vtkCommonMath": [("vtkmodules.vtkCommonMath", "vtkMatrix3x3")],
+        }
+        cached = {"vtkCommonCore": [{"class_name": "vtkObject", "class_doc": "cached"}]}
+        records = _extract_all_class_docs(module_classes, max_workers=1, cached=cached)
+        assert [r["class_name"] for r in records] == ["vtkObject", "vtkMatrix3x3"]
+        assert records[0]["class_doc"] == "cached"
+
+
+class TestLoadCachedRecords:
+    """Tests for incremental extraction caching."""
+
+    module_classes = {
+        "vtkCommonCore": [("vtkmodules.vtkCommonCore", "vtkObject")],
+        "vtkCommonMath": [("vtkmodules.vtkCommonMath", "vtkMatrix3x3")],
+    }
+
+    def _write_previous_run(self, config: Config) -> dict:
+        config.docs_dir.mkdir(parents=True)
+        records = [
+            {"class_name": "vtkObject", "module_name": "vtkCommonCore"},
+            {"class_name": "vtkMatrix3x3", "module_name": "vtkCommonMath"},
+        ]
+        _write_jsonl(records, config.jsonl_output)
+        keys = {m: _module_cache_key(m, classes) for m, classes in self.module_classes.items()}
+        _write_cache_keys(config.extract_cache, keys)
+        return keys
+
+    def test_empty_without_previous_run(self, tmp_path: Path):
+        """Test that nothing is reused on a first run."""
+        config = Config(project_root=tmp_path)
+        assert _load_cached_records(config, self.module_classes, {}) == {}
+
+    def test_reuses_unchanged_modules(self, tmp_path: Path):
+        """Test that only modules with a matching cache key are reused."""
+        config = Config(project_root=tmp_path)
+        keys = self._write_previous_run(config)
+        keys["vtkCommonMath"] = {**keys["vtkCommonMath"], "class_names_hash": "changed"}
+
+        cached = _load_cached_records(config, self.module_classes, keys)
+        assert list(cached) == ["vtkCommonCore"]
+        assert cached["vtkCommonCore"][0]["class_name"] == "vtkObject"
+
+    def test_cache_key_tracks_class_list(self):
+        """Test that adding a class changes the module's cache key."""
+        classes = self.module_classes["vtkCommonCore"]
+        key = _module_cache_key("vtkCommonCore", classes)
+        assert key == _module_cache_key("vtkCommonCore", list(classes))
+        assert key != _module_cache_key("vtkCommonCore", classes + [("vtkmodules.vtkCommonCore", "vtkPoints")])
+
+    def test_cache_key_tracks_vtk_version(self, monkeypatch):
+        """Test that a VTK upgrade changes every module's cache key, covering inherited docs."""
+        import vtkmodules
+
+        classes = self.module_classes["vtkCommonCore"]
+        key = _module_cache_key("vtkCommonCore", classes)
+        monkeypatch.setattr(vtkmodules, "__version__", "0.0.0")
+        assert key != _module_cache_key("vtkCommonCore", classes)
+
+
+class TestWriteJsonl:
+    """Tests for _write_jsonl function."""
+
+    def test_round_trips_records(self, tmp_path: Path):
+        """Test that records with quotes, backslashes and non-ASCII text round-trip."""
+        records = [
+            {"class_name": "vtkA", "class_doc": 'Says "hi" \\ tab\there: ü', "visibility_score": 0.3},
+            {"class_name": "vtkB", "class_doc": "", "semantic_methods": ["Update"]},
+        ]
+        output_path = tmp_path / "docs.jsonl"
+        _write_jsonl(records, output_path)
+
+        with open(output_path, encoding="utf-8") as f:
+            assert [json.loads(line) for line in f] == records
+
+    def test_identical_output_left_untouched(self, tmp_path: Path):
+        """Test that rewriting identical records keeps the file's mtime."""
+        records = [{"class_name": "vtkA", "class_doc": "Docs."}]
+        output_path = tmp_path / "docs.jsonl"
+        _write_jsonl(records, output_path)
+        mtime = output_path.stat().st_mtime_ns
+
+        _write_jsonl(records, output_path)
+        assert output_path.stat().st_mtime_ns == mtime
+        assert list(tmp_path.iterdir()) == [output_path]
+
+        _write_jsonl(records + [{"class_name": "vtkB"}], output_path)
+        assert output_path.read_text().count("\n") == 2
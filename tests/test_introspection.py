@@ -3,6 +3,7 @@
 Tests the public API introspect_class() which returns role, datatypes, and semantic methods.
 """
 
+from vtk_python_docs.extract import introspection
 from vtk_python_docs.extract.introspection import BOILERPLATE_METHODS, introspect_class
 
 
@@ -14,6 +15,17 @@ class TestIntrospectClassRole:
         result = introspect_class("vtkNonExistentClass")
         assert result["role"] == "utility"
 
+    def test_abstract_algorithm_base_returns_filter(self):
+        """Test that a non-instantiable algorithm base class returns filter."""
+        result = introspect_class("vtkImageAlgorithm")
+        assert result["role"] == "filter"
+
+    def test_missing_algorithm_base_returns_utility(self, monkeypatch):
+        """Test that a listed algorithm base missing from this VTK build returns utility."""
+        monkeypatch.delattr(introspection.vtk, "vtkImageAlgorithm")
+        result = introspect_class("vtkImageAlgorithm")
+        assert result["role"] == "utility"
+
     def test_named_colors_returns_color(self):
         """Test that vtkNamedColors returns color."""
         result = introspect_class("vtkNamedColors")
@@ -0,0 +1,59 @@
+"""Unit tests for the shared file and JSON helpers."""
+
+import json
+from pathlib import Path
+
+from vtk_python_docs import _io
+from vtk_python_docs._io import copy_if_changed, write_if_changed
+
+
+class TestJsonCodec:
+    """Tests for json_dumps() and json_loads()."""
+
+    record = {"class_name": "vtkA", "class_doc": 'Says "hi" \\ ü', "visibility_score": 0.3, "methods": ["Update"]}
+
+    def test_round_trips(self):
+        """Test that encoded records decode back unchanged."""
+        assert _io.json_loads(_io.json_dumps(self.record)) == self.record
+
+    def test_stdlib_fallback_matches_orjson_format(self, monkeypatch):
+        """Test that the stdlib fallback writes compact, non-ASCII-preserving JSON."""
+        monkeypatch.setattr(_io, "orjson", None)
+        data = _io.json_dumps(self.record)
+        assert data == json.dumps(self.record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        assert b", " not in data and "ü".encode() in data
+        assert _io.json_loads(data) == self.record
+
+
+class TestCopyIfChanged:
+    """Tests for copy_if_changed function."""
+
+    def test_copies_new_file(self, tmp_path: Path):
+        """Test that a missing destination is copied."""
+        source = tmp_path / "source.pyi"
+        source.write_text("class vtkTest: ...\n")
+        dest = tmp_path / "dest.pyi"
+
+        assert copy_if_changed(source, dest)
+        assert dest.read_text() == source.read_text()
+
+    def test_skips_identical_file(self, tmp_path: Path):
+        """Test that an identical destination is left untouched."""
+        source = tmp_path / "source.pyi"
+        source.write_text("class vtkTest: ...\n")
+        dest = tmp_path / "dest.pyi"
+        dest.write_text("class vtkTest: ...\n")
+
+        assert not copy_if_changed(source, dest)
+
+
+class TestWriteIfChanged:
+    """Tests for write_if_changed function."""
+
+    def test_writes_only_changed_content(self, tmp_path: Path):
+        """Test that write_if_changed skips identical content."""
+        path = tmp_path / "page.md"
+        assert write_if_changed(path, b"# vtkTest\n")
+        assert not write_if_changed(path, b"# vtkTest\n")
+        assert write_if_changed(path, b"# vtkOther\n")
+        assert path.read_bytes() == b"# vtkOther\n"
@@ -52,3 +52,25 @@ class TestCheckLLMConfigured:
         with pytest.raises(SystemExit) as exc_info:
             check_llm_configured()
         assert exc_info.value.code == 1
+
+
+class TestDocHash:
+    """Tests for the classification cache key."""
+
+    def test_ignores_whitespace_and_text_past_truncation(self):
+        """Test that cosmetic and out-of-prompt doc edits keep the cache key."""
+        from vtk_python_docs.extract.llm import _MAX_DOC_LENGTH, doc_hash
+
+        doc = "Reads  a file.\n\n  " + "x" * _MAX_DOC_LENGTH
+        key = doc_hash("vtkReader", doc)
+        assert key == doc_hash("vtkReader", "Reads a file. " + "x" * _MAX_DOC_LENGTH + " more")
+        assert key != doc_hash("vtkReader", "Writes a file. " + "x" * _MAX_DOC_LENGTH)
+
+    def test_changes_with_model(self, monkeypatch):
+        """Test that switching LLM models invalidates the cache key."""
+        from vtk_python_docs.extract import llm
+
+        monkeypatch.setattr(llm, "LLM_MODEL", "ollama/llama3")
+        key = llm.doc_hash("vtkReader", "Reads a file.")
+        monkeypatch.setattr(llm, "LLM_MODEL", "anthropic/claude-3-haiku-20240307")
+        assert key != llm.doc_hash("vtkReader", "Reads a file.")
@@ -66,3 +66,210 @@ class TestClassifyClassesBatch:
             rate_limit=30,
         )
         assert isinstance(result, dict)
+
+
+class TestClassificationCache:
+    """Tests for the persistent classification cache."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_unchanged_and_reclassifies_changed(self, tmp_path, monkeypatch):
+        """Test that only classes with changed docs are sent to the LLM again."""
+        from vtk_python_docs.extract import llm
+
+        monkeypatch.setattr(llm, "_cache_path", tmp_path / "llm-cache.jsonl")
+        monkeypatch.setattr(llm, "_llm_cache", None)
+        calls = []
+
+        async def fake_classify(class_name, class_doc):
+            calls.append(class_name)
+            return {"synopsis": f"{class_doc}", "action_phrase": "testing", "visibility_score": 0.5}
+
+        monkeypatch.setattr(llm, "classify_class", fake_classify)
+
+        await classify_classes_batch([("vtkTest", "Old docs.")])
+        monkeypatch.setattr(llm, "_llm_cache", None)  # force a reload from disk
+        result = await classify_classes_batch([("vtkTest", "Old docs.")])
+        assert calls == ["vtkTest"]
+        assert result["vtkTest"]["synopsis"] == "Old docs."
+
+        result = await classify_classes_batch([("vtkTest", "New docs.")])
+        assert calls == ["vtkTest", "vtkTest"]
+        assert result["vtkTest"]["synopsis"] == "New docs."
+
+        # The replaced classification doesn't linger in the file
+        lines = (tmp_path / "llm-cache.jsonl").read_text().splitlines()
+        assert len(lines) == 1 and "New docs." in lines[0]
+
+    @pytest.mark.asyncio
+    async def test_record_without_doc_hash_is_reclassified(self, tmp_path, monkeypatch):
+        """Test that a cache record without a doc_hash is treated as a miss."""
+        from vtk_python_docs.extract import llm
+
+        cache_path = tmp_path / "llm-cache.jsonl"
+        cache_path.write_text('{"class_name": "vtkTest", "synopsis": "Stale.", "action_phrase": "", "visibility_score": 0.3}\n')
+        monkeypatch.setattr(llm, "_cache_path", cache_path)
+        monkeypatch.setattr(llm, "_llm_cache", None)
+
+        async def fake_classify(class_name, class_doc):
+            return {"synopsis": "Fresh.", "action_phrase": "testing", "visibility_score": 0.5}
+
+        monkeypatch.setattr(llm, "classify_class", fake_classify)
+
+        result = await classify_classes_batch([("vtkTest", "Docs.")])
+        assert result["vtkTest"]["synopsis"] == "Fresh."
+
+
+class TestClassifyClassGroup:
+    """Tests for classify_class_group function."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_with_fallback_for_missing(self, monkeypatch):
+        """Test that a group is sent as one request and missing classes are retried alone."""
+        import litellm
+
+        from vtk_python_docs.extract import llm
+
+        reply = '```json\n[{"class_name": "vtkA", "synopsis": "Does A", "action_phrase": "a", "visibility_score": 2}]\n```'
+        prompts = []
+
+        async def fake_acompletion(model, messages, **kwargs):
+            assert messages[0] == {"role": "system", "content": llm.SYSTEM_PROMPT}
+            prompts.append(messages[-1]["content"])
+            message = type("Message", (), {"content": reply})
+            return type("Response", (), {"choices": [type("Choice", (), {"message": message})]})
+
+        async def fake_classify(class_name, class_doc):
+            return {"synopsis": "Alone.", "action_phrase": "b", "visibility_score": 0.5}
+
+        monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+        monkeypatch.setattr(llm, "classify_class", fake_classify)
+
+        result = await llm.classify_class_group([("vtkA", "A docs."), ("vtkB", "B docs."), ("vtkC", "")])
+        assert len(prompts) == 1
+        assert "vtkA" in prompts[0] and "vtkB" in prompts[0]
+        assert result == {
+            "vtkA": {"synopsis": "Does A.", "action_phrase": "a", "visibility_score": 1.0},
+            "vtkB": {"synopsis": "Alone.", "action_phrase": "b", "visibility_score": 0.5},
+        }
+
+
+    @pytest.mark.asyncio
+    async def test_unknown_names_are_not_matched_by_position(self, monkeypatch):
+        """Test that a reply object naming an unknown class is not assigned to a class by position."""
+        import litellm
+
+        from vtk_python_docs.extract import llm
+
+        reply = '[{"class_name": "vtkTypo", "synopsis": "Wrong", "action_phrase": "x", "visibility_score": 0.1}]'
+
+        async def fake_acompletion(model, messages, **kwargs):
+            message = type("Message", (), {"content": reply})
+            return type("Response", (), {"choices": [type("Choice", (), {"message": message})]})
+
+        async def fake_classify(class_name, class_doc):
+            return {"synopsis": "Alone.", "action_phrase": "b", "visibility_score": 0.5}
+
+        monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+        monkeypatch.setattr(llm, "classify_class", fake_classify)
+
+        result = await llm.classify_class_group([("vtkA", "A docs."), ("vtkB", "B docs.")])
+        assert result == {
+            "vtkA": {"synopsis": "Alone.", "action_phrase": "b", "visibility_score": 0.5},
+            "vtkB": {"synopsis": "Alone.", "action_phrase": "b", "visibility_score": 0.5},
+        }
+
+class TestGroupRateLimiting:
+    """Tests for rate limiting inside classify_class_group."""
+
+    @pytest.mark.asyncio
+    async def test_every_request_takes_a_token(self, monkeypatch):
+        """Test that the one-by-one retries after an empty group reply are rate limited too."""
+        import litellm
+
+        from vtk_python_docs.extract import llm
+
+        async def empty_reply(model, messages, **kwargs):
+            message = type("Message", (), {"content": "[]"})
+            return type("Response", (), {"choices": [type("Choice", (), {"message": message})]})
+
+        async def fake_classify(class_name, class_doc):
+            return {"synopsis": "Alone.", "action_phrase": "b", "visibility_score": 0.5}
+
+        class CountingLimiter:
+            acquired = 0
+
+            async def acquire(self):
+                self.acquired += 1
+
+        monkeypatch.setattr(litellm, "acompletion", empty_reply)
+        monkeypatch.setattr(llm, "classify_class", fake_classify)
+
+        limiter = CountingLimiter()
+        items = [("vtkA", "A docs."), ("vtkB", "B docs."), ("vtkC", "C docs.")]
+        result = await llm.classify_class_group(items, limiter)
+        assert len(result) == 3
+        assert limiter.acquired == 1 + len(items)
+
+
+class TestRateLimiter:
+    """Tests for the token bucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_bursts_then_spaces_requests(self, monkeypatch):
+        """Test that the burst is immediate and later requests wait for refills."""
+        import asyncio
+        import time
+
+        from vtk_python_docs.extract import llm
+
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def recording_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(delay)
+
+        monkeypatch.setattr(llm.asyncio, "sleep", recording_sleep)
+
+        limiter = llm._RateLimiter(rate=20, period=1.0, burst=2)
+        start = time.monotonic()
+        await limiter.acquire()
+        await limiter.acquire()
+        assert sleeps == []
+
+        await limiter.acquire()
+        await limiter.acquire()
+        assert sleeps
+        assert time.monotonic() - start >= 0.09
+
+
+class TestWorkerPool:
+    """Tests for request concurrency in classify_classes_batch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_max_concurrent(self, tmp_path, monkeypatch):
+        """Test that at most max_concurrent group requests are in flight."""
+        import asyncio
+
+        from vtk_python_docs.extract import llm
+
+        monkeypatch.setattr(llm, "_cache_path", tmp_path / "llm-cache.jsonl")
+        monkeypatch.setattr(llm, "_llm_cache", None)
+        monkeypatch.setattr(llm, "LLM_BATCH_SIZE", 1)
+        in_flight = 0
+        peak = 0
+
+        async def fake_group(group, limiter=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {name: {"synopsis": "Ok."} for name, _ in group}
+
+        monkeypatch.setattr(llm, "classify_class_group", fake_group)
+
+        items = [(f"vtk{i}", "Docs.") for i in range(7)]
+        result = await llm.classify_classes_batch(items, max_concurrent=3, rate_limit=60000)
+        assert len(result) == 7
+        assert peak == 3
@@ -134,3 +134,67 @@ class TestGenerateAll:
 
         assert (config.markdown_dir / "vtkCommonCore" / "vtkObject.md").exists()
         assert (config.markdown_dir / "vtkRenderingCore" / "vtkActor.md").exists()
+
+    def test_uses_preloaded_docs(self, tmp_path: Path):
+        """Test that preloaded docs are used without reading the JSONL."""
+        config = Config(project_root=tmp_path)
+        docs_by_module = {
+            "vtkCommonCore": {
+                "vtkObject": {"class_name": "vtkObject", "class_doc": "Base class.", "structured_docs": {}}
+            }
+        }
+
+        result = generate_all(config, docs_by_module=docs_by_module)
+        assert result == 1
+        assert not config.jsonl_output.exists()
+        assert (config.markdown_dir / "vtkCommonCore" / "vtkObject.md").exists()
+
+    def test_methods_filtered_to_key_methods(self, tmp_path: Path):
+        """Test that only key methods are documented, across worker processes."""
+        config = Config(project_root=tmp_path)
+        docs_by_module = {
+            "vtkFiltersSources": {
+                "vtkSphereSource": {
+                    "class_name": "vtkSphereSource",
+                    "semantic_methods": ["SetRadius"],
+                    "structured_docs": {
+                        "sections": {
+                            "|  Methods defined here:": {
+                                "methods": {"SetRadius": "SetRadius(self, r)\nSet the radius.", "Modified": "..."}
+                            }
+                        }
+                    },
+                }
+            },
+            "vtkCommonCore": {"vtkObject": {"class_name": "vtkObject", "structured_docs": {}}},
+        }
+
+        assert generate_all(config, docs_by_module=docs_by_module, max_workers=2) == 2
+
+        class_md = (config.markdown_dir / "vtkFiltersSources" / "vtkSphereSource.md").read_text()
+        assert "### Methods defined here:" in class_md
+        assert "Set the radius." in class_md
+        assert "`Modified`" not in class_md
+
+        # The main index is sorted regardless of input order
+        main_md = (config.markdown_dir / "index.md").read_text()
+        assert main_md.index("vtkCommonCore") < main_md.index("vtkFiltersSources")
+
+    def test_rerun_keeps_unchanged_and_removes_stale(self, tmp_path: Path):
+        """Test that unchanged pages are not rewritten and stale pages are removed."""
+        config = Config(project_root=tmp_path)
+        docs_by_module = {"vtkCommonCore": {"vtkObject": {"class_name": "vtkObject", "class_doc": "Base class."}}}
+        stale_module = config.markdown_dir / "vtkRemoved"
+        stale_module.mkdir(parents=True)
+        (stale_module / "vtkGone.md").write_text("# vtkGone")
+
+        generate_all(config, docs_by_module=docs_by_module)
+        page = config.markdown_dir / "vtkCommonCore" / "vtkObject.md"
+        stale_page = config.markdown_dir / "vtkCommonCore" / "vtkGone.md"
+        stale_page.write_text("# vtkGone")
+        mtime = page.stat().st_mtime_ns
+
+        generate_all(config, docs_by_module=docs_by_module)
+        assert page.stat().st_mtime_ns == mtime
+        assert not stale_page.exists()
+        assert not stale_module.exists()
@@ -4,15 +4,22 @@ Tests the public API generate_all() and verifies output structure.
 """
 
 import json
+import os
 import shutil
+import tempfile
 from pathlib import Path
 
 from vtk_python_docs.config import Config
 from vtk_python_docs.stubs.enhance import (
+    _enhance_stub_file,
     _enhance_stubs,
-    _generate_official_stubs,
+    _is_up_to_date,
     _load_docs_by_module,
+    _read_tail,
+    _write_stamp,
     generate_all,
+    generate_official_stubs,
+    vtk_version_changed,
 )
 
 
@@ -27,25 +34,127 @@ class TestGenerateAll:
         # Returns 0 because either stubs fail or JSONL missing
         assert result == 0 or result > 0  # May succeed if VTK available
 
+    def test_uses_pregenerated_stubs(self, tmp_path: Path):
+        """Test that caller-provided official stubs are enhanced and kept."""
+        config = Config(project_root=tmp_path)
+        stubs_dir = tmp_path / "official"
+        stubs_dir.mkdir()
+        (stubs_dir / "vtkTest.pyi").write_text("class vtkFoo:\n    pass\n")
+        docs_by_module = {"vtkTest": {"vtkFoo": {"class_doc": "Foo docs."}}}
+
+        result = generate_all(config, docs_by_module=docs_by_module, stubs_dir=stubs_dir)
+
+        assert result == 1
+        assert stubs_dir.exists()
+        assert '"""Foo docs."""' in (config.enhanced_stubs_dir / "vtkTest.pyi").read_text()
+
+
+class TestIsUpToDate:
+    """Tests for the build stamp check."""
+
+    def test_false_without_stamp(self, tmp_path: Path):
+        """Test that a missing stamp forces a rebuild."""
+        jsonl_file = tmp_path / "docs.jsonl"
+        jsonl_file.write_text("")
+        assert not _is_up_to_date(jsonl_file, tmp_path / "stubs")
+
+    def test_true_after_stamp(self, tmp_path: Path):
+        """Test that stubs stamped after the JSONL are up to date."""
+        jsonl_file = tmp_path / "docs.jsonl"
+        jsonl_file.write_text("")
+        output_dir = tmp_path / "stubs"
+        output_dir.mkdir()
+        _write_stamp(output_dir)
+        assert _is_up_to_date(jsonl_file, output_dir)
+
+    def test_false_when_jsonl_newer(self, tmp_path: Path):
+        """Test that a rewritten JSONL invalidates the stamp."""
+        jsonl_file = tmp_path / "docs.jsonl"
+        jsonl_file.write_text("")
+        output_dir = tmp_path / "stubs"
+        output_dir.mkdir()
+        _write_stamp(output_dir)
+        stamp_mtime = (output_dir / ".build-stamp").stat().st_mtime
+        os.utime(jsonl_file, (stamp_mtime + 10, stamp_mtime + 10))
+        assert not _is_up_to_date(jsonl_file, output_dir)
+
+    def test_false_when_enhancer_changed(self, tmp_path: Path, monkeypatch):
+        """Test that a changed enhancer module invalidates the stamp."""
+        from vtk_python_docs.stubs import enhance
+
+        jsonl_file = tmp_path / "docs.jsonl"
+        jsonl_file.write_text("")
+        output_dir = tmp_path / "stubs"
+        output_dir.mkdir()
+        _write_stamp(output_dir)
+        monkeypatch.setattr(enhance, "_stamp_text", lambda: "9.9.9\n0")
+        assert not _is_up_to_date(jsonl_file, output_dir)
+
+    def test_vtk_version_changed(self, tmp_path: Path, monkeypatch):
+        """Test that only a missing stamp or another VTK version counts as a VTK change."""
+        from vtk_python_docs.stubs import enhance
+
+        assert vtk_version_changed(tmp_path)
+        _write_stamp(tmp_path)
+        assert not vtk_version_changed(tmp_path)
+        monkeypatch.setattr(enhance, "_get_vtk_version", lambda: "0.0.0")
+        assert vtk_version_changed(tmp_path)
+
+    def test_generate_all_skips_when_up_to_date(self, tmp_path: Path):
+        """Test that generate_all() leaves up-to-date stubs alone."""
+        config = Config(project_root=tmp_path)
+        config.ensure_dirs()
+        config.jsonl_output.write_text("")
+        existing = config.enhanced_stubs_dir / "vtkCommonCore.pyi"
+        existing.write_text("# existing")
+        _write_stamp(config.enhanced_stubs_dir)
+
+        assert generate_all(config) == 1
+        assert existing.read_text() == "# existing"
+
 
 class TestGenerateOfficialStubs:
-    """Tests for _generate_official_stubs function."""
+    """Tests for generate_official_stubs function."""
 
     def test_returns_path_or_none(self):
         """Test that function returns Path or None."""
-        result = _generate_official_stubs(timeout=120)
+        result = generate_official_stubs(timeout=120)
         assert result is None or isinstance(result, Path)
         if result:
             shutil.rmtree(result)
 
     def test_generates_stubs(self):
         """Test that stubs are generated."""
-        temp_dir = _generate_official_stubs(timeout=120)
+        temp_dir = generate_official_stubs(timeout=120)
         assert temp_dir is not None
         pyi_files = list(temp_dir.glob("*.pyi"))
         assert len(pyi_files) > 0
         shutil.rmtree(temp_dir)
 
+    def test_cancelled_generation_returns_none(self):
+        """Test that a cancelled generation stops and returns None."""
+        import threading
+
+        cancel = threading.Event()
+        cancel.set()
+        assert generate_official_stubs(timeout=120, cancel=cancel) is None
+
+
+class TestReadTail:
+    """Tests for _read_tail function."""
+
+    def test_reads_only_the_tail(self):
+        """Test that only the last bytes are returned."""
+        with tempfile.TemporaryFile() as f:
+            f.write(b"head" + b"x" * 10 + b"tail")
+            assert _read_tail(f, size=4) == "tail"
+
+    def test_short_file_read_whole(self):
+        """Test that a file shorter than the tail size is read entirely."""
+        with tempfile.TemporaryFile() as f:
+            f.write(b"error")
+            assert _read_tail(f) == "error"
+
 
 class TestLoadDocsByModule:
     """Tests for _load_docs_by_module function."""
@@ -92,3 +201,65 @@ class TestEnhanceStubs:
         result = _enhance_stubs(stubs_dir, docs_by_module, output_dir)
         assert result == 1
         assert (output_dir / "vtkTest.pyi").exists()
+
+    def test_rerun_keeps_unchanged_and_removes_stale(self, tmp_path: Path):
+        """Test that unchanged stubs are not rewritten and stale stubs are removed."""
+        stubs_dir = tmp_path / "stubs"
+        stubs_dir.mkdir()
+        (stubs_dir / "vtkTest.pyi").write_text("class vtkTest:\n    pass\n")
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        (output_dir / "vtkRemoved.pyi").write_text("class vtkRemoved: ...\n")
+
+        _enhance_stubs(stubs_dir, {}, output_dir)
+        mtime = (output_dir / "vtkTest.pyi").stat().st_mtime_ns
+
+        _enhance_stubs(stubs_dir, {}, output_dir)
+        assert (output_dir / "vtkTest.pyi").stat().st_mtime_ns == mtime
+        assert not (output_dir / "vtkRemoved.pyi").exists()
+
+    def test_docs_from_extracted_records(self, tmp_path: Path):
+        """Test that records shaped like the extractor's output reach the matching stub."""
+        from vtk_python_docs.build import _group_by_module
+        from vtk_python_docs.extract.extractor import _extract_module_docs
+
+        records = _extract_module_docs("vtkCommonMath", [("vtkmodules.vtkCommonMath", "vtkMatrix3x3")])
+        stubs_dir = tmp_path / "stubs"
+        stubs_dir.mkdir()
+        (stubs_dir / "vtkCommonMath.pyi").write_text("class vtkMatrix3x3(vtkObject):\n    pass\n")
+
+        output_dir = tmp_path / "output"
+        _enhance_stubs(stubs_dir, _group_by_module(records), output_dir, max_workers=1)
+        assert '    """vtkMatrix3x3 - ' in (output_dir / "vtkCommonMath.pyi").read_text()
+
+
+class TestEnhanceStubFile:
+    """Tests for _enhance_stub_file function."""
+
+    def test_copies_without_docs(self, tmp_path: Path):
+        """Test that stubs without docs are copied unchanged."""
+        stub_file = tmp_path / "vtkTest.pyi"
+        stub_file.write_text("class vtkTest:\n    pass\n")
+        output_file = tmp_path / "out.pyi"
+
+        assert _enhance_stub_file(stub_file, {}, output_file)
+        assert output_file.read_text() == stub_file.read_text()
+
+    def test_inserts_class_docstring(self, tmp_path: Path):
+        """Test that class docstrings are inserted."""
+        stub_file = tmp_path / "vtkTest.pyi"
+        stub_file.write_text("class vtkTest(vtkObject):\n    pass\n")
+        output_file = tmp_path / "out.pyi"
+
+        assert _enhance_stub_file(stub_file, {"vtkTest": "Test description."}, output_file)
+        assert output_file.read_text() == 'class vtkTest(vtkObject):\n    """Test description."""\n    pass\n'
+
+    def test_keeps_existing_docstring(self, tmp_path: Path):
+        """Test that classes with a docstring are left unchanged."""
+        stub_file = tmp_path / "vtkTest.pyi"
+        stub_file.write_text('class vtkTest:\n    """Existing."""\n    pass\n')
+        output_file = tmp_path / "out.pyi"
+
+        assert _enhance_stub_file(stub_file, {"vtkTest": "New description."}, output_file)
+        assert output_file.read_text() == stub_file.read_text()
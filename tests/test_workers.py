@@ -0,0 +1,11 @@
+"""Unit tests for worker process setup."""
+
+from vtk_python_docs._workers import get_worker_context
+
+
+class TestGetWorkerContext:
+    """Tests for get_worker_context function."""
+
+    def test_never_forks_from_threads(self):
+        """Test that workers are not started with a plain fork()."""
+        assert get_worker_context().get_start_method() in ("forkserver", "spawn")
@@ -0,0 +1,100 @@
+"""File and JSON helpers shared by the build steps.
+
+orjson is used when installed; otherwise the stdlib json module is used,
+configured so both produce byte-identical output.
+
+Code map:
+    json_loads()                   Decode JSON from str or bytes
+    json_dumps()                   Encode JSON to compact UTF-8 bytes
+    copy_if_changed()              Copy a file only if its content changed
+    write_if_changed()             Write a file only if its content changed
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: JSON text, as str or UTF-8 bytes.
+
+    Returns:
+        The decoded value.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's error
+            type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode a value as compact JSON.
+
+    Args:
+        obj: Value to encode.
+
+    Returns:
+        UTF-8 encoded JSON without whitespace between tokens, non-ASCII text
+        kept as-is (orjson's output format).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def copy_if_changed(source: Path, path: Path) -> bool:
+    """Copy a file unless the destination already holds identical content.
+
+    shutil.copyfile lets the kernel copy the data (sendfile on Linux), so the
+    bytes are only read into Python when the sizes match and need comparing.
+
+    Args:
+        source: File to copy.
+        path: Destination file.
+
+    Returns:
+        True if the file was copied, False if it was already up to date.
+    """
+    try:
+        if path.stat().st_size == source.stat().st_size and path.read_bytes() == source.read_bytes():
+            return False
+    except FileNotFoundError:
+        pass
+
+    shutil.copyfile(source, path)
+    return True
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to a file unless it already holds identical content.
+
+    Leaving unchanged files untouched keeps their mtimes stable, so IDEs and
+    type checkers watching the output directories don't re-index them.
+
+    Args:
+        path: File to write.
+        data: New file content.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.write_bytes(data)
+    return True
@@ -0,0 +1,33 @@
+"""Worker process setup shared by the build steps.
+
+Code map:
+    get_worker_context()           Pick the start method for worker processes
+"""
+
+import multiprocessing
+from collections.abc import Sequence
+from multiprocessing.context import BaseContext
+
+
+def get_worker_context(preload: Sequence[str] = ()) -> BaseContext:
+    """Pick the multiprocessing start method for worker processes.
+
+    Build steps create their process pools from threads (stubs and markdown
+    run concurrently), and fork() from a multi-threaded process can hand a
+    child a lock another thread was holding. Workers are therefore started
+    from a fork server, or spawned where that isn't available.
+
+    Args:
+        preload: Modules the fork server imports once, so every worker starts
+            with them loaded. Only takes effect if the fork server isn't
+            running yet.
+
+    Returns:
+        A forkserver context where available, else spawn.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        if preload:
+            context.set_forkserver_preload(list(preload))
+        return context
+    return multiprocessing.get_context("spawn")
@@ -1,26 +1,36 @@
 """Programmatic build pipeline for VTK Python documentation."""
 
+import os
+import shutil
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from .config import Config, get_config
 from .extract import extract_all
 from .markdown import generate_all as generate_markdown
 from .stubs import generate_all as generate_stubs
+from .stubs import generate_official_stubs, vtk_version_changed
 
 
-def build_all(config: Config | None = None, clean_first: bool = True, max_workers: int = 12) -> bool:
+def build_all(config: Config | None = None, clean_first: bool = True, max_workers: int | None = None) -> bool:
     """Run the complete VTK documentation build pipeline.
 
     This function orchestrates all steps of the documentation generation:
     1. Clean previous build (optional)
-    2. Extract VTK documentation (writes directly to JSONL)
-    3. Generate and enhance VTK stubs (in one step, no intermediate files)
-    4. Generate markdown documentation
+    2. Extract VTK documentation (writes directly to JSONL), while the
+       official VTK stubs are generated in the background
+    3. Enhance VTK stubs (in one step, no intermediate files)
+    4. Generate markdown documentation (concurrently with step 3)
 
     Args:
         config: Configuration instance. Uses default if not provided.
         clean_first: Whether to clean output directories before building.
         max_workers: Maximum number of parallel workers for processing.
+                     Defaults to the number of CPUs. Split between the stub
+                     and markdown steps while they run concurrently.
 
     Returns:
         True if build succeeded, False otherwise.
@@ -39,35 +49,62 @@ def build_all(config: Config | None = None, clean_first: bool = True, max_worker
         config.clean()
         print(f"✅ Cleaning completed in {time.time() - start:.1f}s")
 
-    # Step 2: Extract VTK documentation (writes directly to JSONL)
-    print("\n🔧 Extracting VTK documentation...")
-    start = time.time()
-    try:
-        extract_all(config)
-        print(f"✅ Extraction completed in {time.time() - start:.1f}s")
-    except Exception as e:
-        print(f"❌ Extraction failed: {e}")
-        return False
-
-    # Step 3: Generate and enhance VTK stubs
-    print("\n🔧 Generating and enhancing Python stubs...")
-    start = time.time()
-    try:
-        generate_stubs(config)
-        print(f"✅ Stub generation & enhancement completed in {time.time() - start:.1f}s")
-    except Exception as e:
-        print(f"❌ Stub generation/enhancement failed: {e}")
-        return False
+    # The official stubs come from VTK itself and don't depend on the extracted
+    # docs, so generate them (in a subprocess) while extraction runs. Whether
+    # the JSONL changes is only known after extraction, so start early only
+    # when the stubs are certain to be rebuilt: no stamp, or another VTK
+    stubs_executor = ThreadPoolExecutor(max_workers=1)
+    cancel_stubs = threading.Event()
+    official_stubs = None
+    if vtk_version_changed(config.enhanced_stubs_dir):
+        official_stubs = stubs_executor.submit(generate_official_stubs, cancel=cancel_stubs)
 
-    # Step 4: Generate markdown documentation
-    print("\n🔧 Generating markdown documentation...")
-    start = time.time()
     try:
-        generate_markdown(config)
-        print(f"✅ Markdown generation completed in {time.time() - start:.1f}s")
-    except Exception as e:
-        print(f"❌ Markdown generation failed: {e}")
-        return False
+        # Step 2: Extract VTK documentation (writes directly to JSONL)
+        print("\n🔧 Extracting VTK documentation...")
+        start = time.time()
+        try:
+            records = extract_all(config, max_workers=max_workers)
+            print(f"✅ Extraction completed in {time.time() - start:.1f}s")
+        except Exception as e:
+            print(f"❌ Extraction failed: {e}")
+            return False
+
+        # Reuse the extracted records so later steps don't re-parse the JSONL
+        docs_by_module = _group_by_module(records)
+
+        # Steps 3 & 4: Stubs and markdown both depend only on the extracted docs,
+        # so they run concurrently, sharing the worker budget between them
+        print("\n🔧 Generating Python stubs and markdown documentation...")
+        total_workers = max_workers or os.cpu_count() or 1
+        stub_workers = max(1, total_workers // 2)
+        markdown_workers = max(1, total_workers - stub_workers)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    _run_step,
+                    "Stub generation & enhancement",
+                    lambda: generate_stubs(
+                        config,
+                        docs_by_module=docs_by_module,
+                        max_workers=stub_workers,
+                        stubs_dir=official_stubs.result() if official_stubs else None,
+                    ),
+                ),
+                executor.submit(
+                    _run_step,
+                    "Markdown generation",
+                    lambda: generate_markdown(config, docs_by_module=docs_by_module, max_workers=markdown_workers),
+                ),
+            ]
+            if not all([future.result() for future in futures]):
+                return False
+    finally:
+        # A failed build doesn't wait for the generator to finish
+        cancel_stubs.set()
+        stubs_executor.shutdown()
+        if official_stubs and (stubs_dir := official_stubs.result()):
+            shutil.rmtree(stubs_dir, ignore_errors=True)
 
     # Summary
     total_time = time.time() - total_start
@@ -88,3 +125,39 @@ def build_all(config: Config | None = None, clean_first: bool = True, max_worker
     print(f"   • Query {config.jsonl_output} with: vtk-docs search <query>")
 
     return True
+
+
+def _run_step(name: str, step: Callable[[], Any]) -> bool:
+    """Run a single build step, reporting its outcome and duration.
+
+    Args:
+        name: Human-readable step name used in progress messages.
+        step: Callable that performs the step.
+
+    Returns:
+        True if the step succeeded, False otherwise.
+    """
+    start = time.time()
+    try:
+        step()
+        print(f"✅ {name} completed in {time.time() - start:.1f}s")
+        return True
+    except Exception as e:
+        print(f"❌ {name} failed: {e}")
+        return False
+
+
+def _group_by_module(records: list[dict[str, Any]]) -> dict[str, dict[str, dict[str, Any]]]:
+    """Group extracted class records by module.
+
+    Args:
+        records: Class documentation records returned by extract_all().
+
+    Returns:
+        Dictionary mapping module names to {class_name: class_data}.
+    """
+    docs_by_module: dict[str, dict[str, dict[str, Any]]] = {}
+    for record in records:
+        module_name = record.get("module_name", "unknown")
+        docs_by_module.setdefault(module_name, {})[record.get("class_name", "")] = record
+    return docs_by_module
@@ -19,18 +19,21 @@ def extract(
     output_dir: Path | None = typer.Option(
         None, "--output", "-o", help="Output directory for VTK documentation JSON files"
     ),
+    force: bool = typer.Option(False, "--force", help="Re-extract every module, even if unchanged"),
 ):
     """Extract VTK documentation using Python introspection."""
     config = get_config()
     if output_dir:
         config._project_root = output_dir.parent.parent
 
-    extract_all(config)
+    extract_all(config, force=force)
 
 @app.command()
-def stubs():
+def stubs(
+    force: bool = typer.Option(False, "--force", help="Regenerate even if stubs are up to date"),
+):
     """Generate and enhance VTK Python stubs."""
-    generate_stubs()
+    generate_stubs(force=force)
 
 @app.command()
 def markdown():
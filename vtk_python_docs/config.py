@@ -38,6 +38,11 @@ class Config:
         """Path to consolidated JSONL database."""
         return self.docs_dir / "vtk-python-docs.jsonl"
 
+    @property
+    def extract_cache(self) -> Path:
+        """Path to the per-module cache keys of the last extraction."""
+        return self.docs_dir / ".extract-cache.json"
+
     @property
     def enhanced_stubs_dir(self) -> Path:
         """Directory for enhanced VTK stubs with documentation."""
@@ -57,13 +62,17 @@ class Config:
     def clean(self) -> None:
         """Remove all generated output directories."""
         import shutil
+        from concurrent.futures import ThreadPoolExecutor
 
-        for path in [self.enhanced_stubs_dir, self.markdown_dir]:
-            if path.exists():
-                shutil.rmtree(path)
+        # The trees are independent and removal is syscall-bound, so remove
+        # them concurrently
+        paths = [path for path in (self.enhanced_stubs_dir, self.markdown_dir) if path.exists()]
+        with ThreadPoolExecutor(max_workers=max(1, len(paths))) as executor:
+            list(executor.map(shutil.rmtree, paths))
 
-        if self.jsonl_output.exists():
-            self.jsonl_output.unlink()
+        for path in (self.jsonl_output, self.extract_cache):
+            if path.exists():
+                path.unlink()
 
 # Synopsis generation settings
 SYNOPSIS_MAX_WORDS = 18
@@ -6,24 +6,34 @@ VTK embeds Doxygen documentation from C++ headers into Python __doc__ strings.
 Code map:
     extract_all()                      Main entry point, orchestrates full pipeline
         _get_vtk_classes()             Discover VTK classes from vtkmodules
-        _extract_all_class_docs()      Extract docs for all classes
-            _extract_class_docs()      Extract docs for a single class
+        _module_cache_key()            Cache key of one module (incremental extraction)
+        _load_cached_records()         Reuse records of unchanged modules from the last run
+            _group_records()           Group records by module in discovery order
+        _extract_all_class_docs()      Extract docs for all (changed) classes
+            _extract_module_isolated() Run one module in its own worker process
+                _extract_module_docs() Extract docs for one module's classes
+                    _extract_class_docs()  Extract docs for a single class
                 _parse_help_structure()    Parse help() output into sections
                     _extract_methods_from_section()  Extract method docs from a section
                     _clean_docstring()               Clean/normalize docstrings
         _classify_all()                LLM classification (synopsis, action_phrase, visibility_score)
         _write_jsonl()                 Write records to JSONL file
+        _write_cache_keys()            Record module cache keys for the next run
 """
 
 # Standard library
 import asyncio
+import filecmp
+import hashlib
 import importlib
 import inspect
-import io
-import json
+import os
 import pkgutil
+import pydoc
 import re
-import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.context import BaseContext
 from pathlib import Path
 from typing import Any
 
@@ -31,16 +41,45 @@ from typing import Any
 import vtkmodules
 
 # Local
+from .._io import json_dumps, json_loads
+from .._workers import get_worker_context
 from ..config import Config, get_config
+from . import introspection
 from .introspection import introspect_class
 from .llm import check_llm_configured, classify_classes_batch
 
+# Runs of 2+ consecutive blank lines in a cleaned docstring
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
-def extract_all(config: Config | None = None) -> list[dict[str, Any]]:
+# Section header markers in VTK help() output, e.g. " |  Methods defined here:"
+# (alternatives factored by prefix so the scan stays fast)
+_SECTION_HEADER_RE = re.compile(
+    r"Methods (?:defined here:|inherited from)|Static methods defined here:"
+    r"|Data (?:descriptors (?:defined here:|inherited from)|and other attributes defined here:)"
+    r"|Class methods inherited from"
+)
+
+# Help content lines, i.e. " |  " followed by text (blank " |" lines excluded)
+_CONTENT_LINE_RE = re.compile(r"^ \|  .*$", re.MULTILINE)
+
+# Method signature lines: " |  GetClassName(...)", but not indented doc
+# continuation lines such as " |      Return the class name."
+_METHOD_SIGNATURE_RE = re.compile(r"^ \|  (?!    ).*\(", re.MULTILINE)
+
+
+def extract_all(
+    config: Config | None = None, max_workers: int | None = None, force: bool = False
+) -> list[dict[str, Any]]:
     """Extract documentation for all VTK classes to JSONL.
 
+    Modules whose library file and class list are unchanged since the last run
+    reuse their records from the existing JSONL instead of being re-extracted.
+
     Args:
         config: Configuration instance. Uses default if not provided.
+        max_workers: Maximum number of worker processes for extraction.
+                     Defaults to the number of CPUs.
+        force: Re-extract every module, ignoring the previous run.
 
     Returns:
         List of class documentation records.
@@ -56,14 +95,20 @@ def extract_all(config: Config | None = None) -> list[dict[str, Any]]:
     # Ensure output directory exists
     config.docs_dir.mkdir(parents=True, exist_ok=True)
 
+    # Reuse records of modules that haven't changed since the last run
+    cache_keys = {vtk_module: _module_cache_key(vtk_module, classes) for vtk_module, classes in module_classes.items()}
+    cached = {} if force else _load_cached_records(config, module_classes, cache_keys)
+
     # Extract documentation
-    all_records = _extract_all_class_docs(module_classes)
+    all_records = _extract_all_class_docs(module_classes, max_workers, cached=cached)
 
     # Classify with LLM (synopsis, action_phrase, visibility_score)
     _classify_all(all_records)
 
     # Write to JSONL
     _write_jsonl(all_records, config.jsonl_output)
+    extracted = _group_records(all_records, module_classes)
+    _write_cache_keys(config.extract_cache, {m: cache_keys[m] for m in extracted})
 
     print("=" * 50)
     print("✅ Extraction completed!")
@@ -79,15 +124,19 @@ def _get_vtk_classes() -> dict[str, list[tuple[str, str]]]:
     Returns:
         Dictionary mapping module names to lists of (full_module_path, class_name) tuples.
     """
-    all_vtkmodules = []
-    for importer, modname, ispkg in pkgutil.iter_modules(vtkmodules.__path__):
-        if modname.startswith("vtk"):
-            all_vtkmodules.append(modname)
+    # Modules and classes (dir() is sorted) are emitted in canonical sorted
+    # order, so the JSONL is already sorted and consumers don't need to re-sort
+    all_vtkmodules = sorted(
+        modname for _, modname, _ in pkgutil.iter_modules(vtkmodules.__path__) if modname.startswith("vtk")
+    )
 
     print(f"🔍 Discovered {len(all_vtkmodules)} vtkmodules")
 
     module_classes: dict[str, list[tuple[str, str]]] = {}
     total_classes = 0
+    # ids of the class objects already listed, so a class re-exported from
+    # another module is only introspected once (under the first module)
+    seen: set[int] = set()
 
     for module_name in all_vtkmodules:
         try:
@@ -103,7 +152,8 @@ def _get_vtk_classes() -> dict[str, list[tuple[str, str]]]:
             for name in dir(module):
                 if name.startswith("vtk") and not name.startswith("vtk_") and not name.startswith("vtkm"):
                     attr = getattr(module, name)
-                    if inspect.isclass(attr):
+                    if inspect.isclass(attr) and id(attr) not in seen:
+                        seen.add(id(attr))
                         if module_name not in module_classes:
                             module_classes[module_name] = []
                         module_classes[module_name].append((full_module, name))
@@ -114,44 +164,181 @@ def _get_vtk_classes() -> dict[str, list[tuple[str, str]]]:
     print(f"📦 Found {total_classes} VTK classes across {len(module_classes)} modules")
     return module_classes
 
-def _extract_all_class_docs(module_classes: dict[str, list[tuple[str, str]]]) -> list[dict[str, Any]]:
+def _module_cache_key(vtk_module: str, classes: list[tuple[str, str]]) -> dict[str, Any]:
+    """Compute the cache key that decides whether a module must be re-extracted.
+
+    Args:
+        vtk_module: Short module name (e.g., 'vtkCommonCore').
+        classes: (full_module_path, class_name) tuples for this module.
+
+    Returns:
+        Dictionary with the module library's mtime, a hash of its class names,
+        the VTK version and the mtime of the extraction code itself.
+    """
+    module = importlib.import_module(f"vtkmodules.{vtk_module}")
+    class_names = ",".join(sorted(class_name for _, class_name in classes))
+    return {
+        "mtime": os.path.getmtime(module.__file__),
+        "class_names_hash": hashlib.blake2b(class_names.encode("utf-8")).hexdigest(),
+        # help() output includes docs inherited from base classes in other
+        # modules, which this module's library mtime doesn't cover
+        "vtk_version": vtkmodules.__version__,
+        # Changes to the parser or introspection invalidate every module
+        "extractor_mtime": max(os.path.getmtime(__file__), os.path.getmtime(introspection.__file__)),
+    }
+
+def _load_cached_records(
+    config: Config, module_classes: dict[str, list[tuple[str, str]]], cache_keys: dict[str, dict[str, Any]]
+) -> dict[str, list[dict[str, Any]]]:
+    """Load the previous run's records for modules whose cache key still matches.
+
+    Args:
+        config: Configuration instance.
+        module_classes: Dictionary from get_vtk_classes().
+        cache_keys: Current cache key of each module from _module_cache_key().
+
+    Returns:
+        Dictionary mapping module names to their reusable records.
+    """
+    try:
+        with open(config.extract_cache, "rb") as f:
+            previous_keys = json_loads(f.read())
+        with open(config.jsonl_output, "rb") as f:
+            previous_records = [json_loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return {}
+
+    unchanged = {m: classes for m, classes in module_classes.items() if previous_keys.get(m) == cache_keys[m]}
+    return _group_records(previous_records, unchanged)
+
+def _group_records(
+    records: list[dict[str, Any]], module_classes: dict[str, list[tuple[str, str]]]
+) -> dict[str, list[dict[str, Any]]]:
+    """Group class records by module, in discovery order.
+
+    Args:
+        records: Class documentation records.
+        module_classes: Dictionary from get_vtk_classes().
+
+    Returns:
+        Dictionary mapping module names to their records; modules without any
+        record are left out.
+    """
+    by_class = {(record.get("module_name"), record.get("class_name")): record for record in records}
+    grouped = {}
+    for vtk_module, classes in module_classes.items():
+        module_records = [
+            by_class[vtk_module, class_name] for _, class_name in classes if (vtk_module, class_name) in by_class
+        ]
+        if module_records:
+            grouped[vtk_module] = module_records
+    return grouped
+
+def _extract_all_class_docs(
+    module_classes: dict[str, list[tuple[str, str]]],
+    max_workers: int | None = None,
+    cached: dict[str, list[dict[str, Any]]] | None = None,
+) -> list[dict[str, Any]]:
     """Extract documentation for all VTK classes.
 
     Args:
         module_classes: Dictionary from get_vtk_classes().
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
+        cached: Records of unchanged modules to reuse instead of extracting them.
 
     Returns:
         List of class documentation records.
     """
-    total_classes = sum(len(classes) for classes in module_classes.values())
-    all_records = []
+    records_by_module: dict[str, list[dict[str, Any]]] = dict(cached or {})
+    if records_by_module:
+        print(f"♻️  Reusing {len(records_by_module)} unchanged modules from the previous run")
+
+    # help() parsing and introspection are CPU-bound, so extract modules in
+    # worker processes, largest modules first so none is left straggling
+    modules = sorted(
+        (m for m in module_classes if m not in records_by_module), key=lambda m: len(module_classes[m]), reverse=True
+    )
+    total_classes = sum(len(module_classes[m]) for m in modules)
     total_processed = 0
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(modules)))
+    # Each module gets a fresh worker, forked from a server that has already
+    # imported VTK and this module, so a worker starts in milliseconds rather
+    # than paying for the VTK import again
+    context = get_worker_context(["vtkmodules.all", __name__])
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_extract_module_isolated, context, vtk_module, module_classes[vtk_module]): vtk_module
+            for vtk_module in modules
+        }
+        for future in as_completed(futures):
+            vtk_module = futures[future]
+            records_by_module[vtk_module] = future.result()
+            total_processed += len(module_classes[vtk_module])
+            print(f"🔧 Extracted {vtk_module} ({len(module_classes[vtk_module])} classes) - "
+                  f"{total_processed}/{total_classes}")
 
-    for vtk_module, classes in module_classes.items():
-        print(f"🔧 Extracting {vtk_module} ({len(classes)} classes)...")
-
-        for module_name, class_name in classes:
-            class_docs = _extract_class_docs(module_name, class_name)
-            if class_docs:
-                # Add VTK introspection data (role, datatypes, semantic_methods)
-                introspection = introspect_class(class_name)
-                all_records.append({
-                    "class_name": class_name,
-                    "module_name": vtk_module,
-                    **class_docs,
-                    **introspection,
-                })
-
-            total_processed += 1
-            if total_processed % 100 == 0:
-                print(f"   Processed {total_processed}/{total_classes} classes...")
+    # Reassemble in discovery order so the JSONL stays canonically sorted
+    all_records = [record for vtk_module in module_classes for record in records_by_module.get(vtk_module, [])]
 
     print(f"✅ Extracted {len(all_records)} classes")
     return all_records
 
 
+def _extract_module_isolated(
+    context: BaseContext, vtk_module: str, classes: list[tuple[str, str]]
+) -> list[dict[str, Any]]:
+    """Extract one module's docs in a fresh worker process.
+
+    Introspection instantiates every class, and some VTK classes crash depending
+    on what was instantiated before them in the same process (vtkOpenGLAvatar
+    segfaults after vtkRenderingLabel and vtkRenderingFreeType classes), so
+    each module gets a clean process and a crash only loses that module.
+
+    Args:
+        context: Multiprocessing context from get_worker_context().
+        vtk_module: Short module name (e.g., 'vtkCommonCore').
+        classes: (full_module_path, class_name) tuples for this module.
+
+    Returns:
+        List of class documentation records, empty if the worker crashed.
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        try:
+            return executor.submit(_extract_module_docs, vtk_module, classes).result()
+        except BrokenProcessPool:
+            print(f"❌ {vtk_module}: worker process crashed, skipping module")
+            return []
+
+
+def _extract_module_docs(vtk_module: str, classes: list[tuple[str, str]]) -> list[dict[str, Any]]:
+    """Extract documentation for the classes of one VTK module.
+
+    Args:
+        vtk_module: Short module name (e.g., 'vtkCommonCore').
+        classes: (full_module_path, class_name) tuples for this module.
+
+    Returns:
+        List of class documentation records.
+    """
+    records = []
+    for module_name, class_name in classes:
+        class_docs = _extract_class_docs(module_name, class_name)
+        if class_docs:
+            # Add VTK introspection data (role, datatypes, semantic_methods)
+            introspection = introspect_class(class_name)
+            # class_docs carries the full "vtkmodules." path; records (and the
+            # stub files and markdown directories keyed by them) use the short name
+            records.append({
+                "class_name": class_name,
+                **class_docs,
+                "module_name": vtk_module,
+                **introspection,
+            })
+    return records
+
+
 def _extract_class_docs(module_name: str, class_name: str) -> dict[str, Any]:
-    """Extract structured documentation for a VTK class using help() output.
+    """Extract structured documentation for a VTK class using help() text.
 
     Args:
         module_name: Name of the module (e.g., 'vtkmodules.vtkCommonCore').
@@ -164,15 +351,9 @@ def _extract_class_docs(module_name: str, class_name: str) -> dict[str, Any]:
         module = importlib.import_module(module_name)
         cls = getattr(module, class_name)
 
-        # Capture help() output
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = io.StringIO()
-
-        try:
-            help(cls)
-            help_text = captured_output.getvalue()
-        finally:
-            sys.stdout = old_stdout
+        # Render the same text help() would page, without swapping sys.stdout
+        # (which is process-global) or going through pager detection
+        help_text = pydoc.render_doc(cls, "Help on %s:", renderer=pydoc.plaintext)
 
         parsed_docs = _parse_help_structure(help_text, class_name)
 
@@ -199,73 +380,36 @@ def _parse_help_structure(help_text: str, class_name: str) -> dict[str, Any]:
     Returns:
         Dictionary with structured documentation sections.
     """
-    lines = help_text.split("\n")
+    # Extract class docstring: from "class vtk*" to line before "Method resolution order:"
+    mro = help_text.find("Method resolution order:")
+    header_text = help_text if mro < 0 else help_text[: help_text.rfind("\n", 0, mro) + 1]
 
     class_doc_lines = []
     in_class_doc = False
-
-   # Extract class docstring: from "class vtk*" to line before "Method resolution order:"
-    for line in lines:
+    for line in header_text.split("\n"):
         if line.strip().startswith("class " + class_name):
             in_class_doc = True
-            continue
-        elif "Method resolution order:" in line:
-            break
         elif in_class_doc and line.startswith(" |  "):
             class_doc_lines.append(line[4:])
 
     class_doc = _clean_docstring("\n".join(class_doc_lines).strip())
 
-    # Parse sections
+    # Parse sections: a header is any line containing a section marker, and
+    # its content runs until the next header line (or the end of the text)
+    header_lines = []
+    for marker in _SECTION_HEADER_RE.finditer(help_text):
+        line_start = help_text.rfind("\n", 0, marker.start()) + 1
+        if not header_lines or header_lines[-1][0] != line_start:
+            line_end = help_text.find("\n", marker.end())
+            header_lines.append((line_start, len(help_text) if line_end < 0 else line_end))
+
     sections = {}
-    current_section = None
-    current_content = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Check if line is a section header in VTK help() format:
-        #   Match:
-        #     " |  Methods defined here:"
-        #     " |  ... (various section types)"
-        #   Skip:
-        #     " |  GetClassName(...)"        <- Method signature
-        #     " |      Return the class..."  <- Doc continuation
-        is_section_header = any(header in line for header in (
-            "Methods defined here:",
-            "Static methods defined here:",
-            "Data descriptors defined here:",
-            "Data and other attributes defined here:",
-            "Methods inherited from",
-            "Data descriptors inherited from",
-            "Class methods inherited from",
-        ))
-
-        if is_section_header:
-            # Save previous section if it has content
-            if current_section and current_content:
-                section_content = "\n".join(current_content)
-                methods = _extract_methods_from_section(section_content)
-                if methods:
-                    sections[current_section] = {"methods": methods, "method_count": len(methods)}
-
-            # Start new section
-            current_section = line.strip().replace(" |  ", "")
-            current_content = []
-
-        elif current_section and line.startswith(" |  "):
-            # Collect content lines within current section
-            current_content.append(line)
-
-        i += 1
-
-    # Save the last section (no header follows it to trigger save)
-    if current_section and current_content:
-        section_content = "\n".join(current_content)
-        methods = _extract_methods_from_section(section_content)
+    for i, (line_start, line_end) in enumerate(header_lines):
+        section_end = header_lines[i + 1][0] if i + 1 < len(header_lines) else len(help_text)
+        methods = _extract_methods_from_section(help_text[line_end:section_end])
         if methods:
-            sections[current_section] = {"methods": methods, "method_count": len(methods)}
+            section_name = help_text[line_start:line_end].strip().replace(" |  ", "")
+            sections[section_name] = {"methods": methods, "method_count": len(methods)}
 
     return {"class_doc": class_doc, "sections": sections}
 
@@ -278,58 +422,22 @@ def _extract_methods_from_section(section_content: str) -> dict[str, str]:
     Returns:
         Dictionary mapping method names to their documentation.
     """
+    # Keep only help content lines (" |  ..."), dropping blank " |" lines
+    content = "\n".join(_CONTENT_LINE_RE.findall(section_content))
+
     methods = {}
-    lines = section_content.split("\n")
-
-    current_method = None
-    current_doc = []
-
-    for line in lines:
-        # Check if line is a method signature in VTK help() format:
-        #   Match:
-        #     " |  GetClassName(...)"        <- Method signature (4 spaces after |)
-        #     " |  SetMapper(...)"           <- Method signature (4 spaces after |)
-        #   Skip:
-        #     " |      Return the class..."  <- Doc continuation (6 spaces after |)
-        #     " |      C++: const char*..."  <- Doc continuation (6 spaces after |)
-        #     " |  --------------"           <- Separator line
-        is_method_signature = (
-            # Match
-            line.strip()  # Not empty
-            and line.startswith(" |  ")  # Help content line (4 spaces)
-            and "(" in line  # Has parenthesis (method signature)
-            # Skip
-            and not line.startswith(" |      ")  # Not indented doc line (6 spaces)
-            and not line.strip().startswith("------")  # Not separator
-        )
-
-        if is_method_signature:
-            # Save previous method if exists
-            if current_method and current_doc:
-                method_doc_text = "\n".join(current_doc)
-                cleaned_doc = _clean_docstring(method_doc_text)
-                if cleaned_doc:
-                    methods[current_method] = cleaned_doc
-
-            # Start new method: extract name from "GetClassName(...)" -> "GetClassName"
-            method_line = line.replace(" |  ", "")
-            if "(" in method_line:
-                current_method = method_line.split("(")[0].strip()
-                current_doc = [method_line]
-            else:
-                current_method = None
-                current_doc = []
-
-        elif current_method and line.startswith(" |  "):
-            # Collect doc continuation lines
-            current_doc.append(line.replace(" |  ", ""))
-
-    # Save the last method (no next signature to trigger save)
-    if current_method and current_doc:
-        method_doc_text = "\n".join(current_doc)
-        cleaned_doc = _clean_docstring(method_doc_text)
-        if cleaned_doc:
-            methods[current_method] = cleaned_doc
+    signatures = list(_METHOD_SIGNATURE_RE.finditer(content))
+    for i, signature in enumerate(signatures):
+        # A method's doc runs from its signature to the line before the next one
+        doc_end = signatures[i + 1].start() - 1 if i + 1 < len(signatures) else len(content)
+        method_doc_text = content[signature.start() : doc_end].replace(" |  ", "")
+
+        # "GetClassName(...)" -> "GetClassName"
+        method_name = method_doc_text.split("(", 1)[0].strip()
+        if method_name:
+            cleaned_doc = _clean_docstring(method_doc_text)
+            if cleaned_doc:
+                methods[method_name] = cleaned_doc
 
     return methods
 
@@ -346,19 +454,17 @@ def _clean_docstring(docstring: str) -> str:
         return ""
 
     # Step 1: Remove C++ lines (signatures, virtual declarations, scope operators)
-    lines = docstring.strip().split("\n")
-    lines = [
-        line for line in lines
-        if not line.strip().startswith("C++:")
-        and "C++:" not in line
-        and not line.strip().startswith("virtual ")
-        and not ("::" in line and "vtk" in line.lower())
-    ]
-
-    # Step 2: Strip whitespace and normalize blank lines
-    cleaned = "\n".join(line.strip() for line in lines)
-    cleaned = cleaned.strip()  # Remove leading/trailing blank lines
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)  # Collapse 2+ consecutive blank lines to one
+    # and strip whitespace, in a single pass that strips each line only once
+    lines = []
+    for line in docstring.strip().split("\n"):
+        stripped = line.strip()
+        if "C++:" in stripped or stripped.startswith("virtual ") or ("::" in stripped and "vtk" in stripped.lower()):
+            continue
+        lines.append(stripped)
+
+    # Step 2: Normalize blank lines
+    cleaned = "\n".join(lines).strip()  # Remove leading/trailing blank lines
+    cleaned = _BLANK_LINES_RE.sub("\n\n", cleaned)  # Collapse 2+ consecutive blank lines to one
 
     return cleaned
 
@@ -395,6 +501,16 @@ def _classify_all(all_records: list[dict[str, Any]]) -> None:
     print(f"   ✅ Classified {classified_count}/{len(all_records)} classes")
 
 
+def _write_cache_keys(cache_file: Path, cache_keys: dict[str, dict[str, Any]]) -> None:
+    """Record the cache keys of the modules just written to the JSONL.
+
+    Args:
+        cache_file: Path to the cache key file.
+        cache_keys: Cache key of each extracted module.
+    """
+    with open(cache_file, "wb") as f:
+        f.write(json_dumps(cache_keys))
+
 def _write_jsonl(records: list[dict[str, Any]], output_path: str | Path) -> None:
     """Write records to JSONL file.
 
@@ -403,6 +519,19 @@ def _write_jsonl(records: list[dict[str, Any]], output_path: str | Path) -> None
         output_path: Path to output JSONL file.
     """
     print(f"\n💾 Writing to {output_path}...")
-    with open(output_path, "w", encoding="utf-8") as jsonl_file:
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+
+    # Encode straight to UTF-8 bytes (with orjson when available) through a
+    # large write buffer
+    with open(temp_path, "wb", buffering=1 << 20) as jsonl_file:
         for record in records:
-            jsonl_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            jsonl_file.write(json_dumps(record))
+            jsonl_file.write(b"\n")
+
+    # Leave an identical file (and its mtime) alone, so the stub build stamp
+    # still counts as up to date
+    if output_path.exists() and filecmp.cmp(temp_path, output_path, shallow=False):
+        temp_path.unlink()
+    else:
+        os.replace(temp_path, output_path)
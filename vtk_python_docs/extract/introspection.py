@@ -8,6 +8,7 @@ Computes these fields at extraction time to include in JSONL records:
 
 Code map:
     introspect_class()             Main entry point, returns all introspection data
+        _new_instance()            Instantiate a VTK class once for the checks below
         _classify_vtk_class()      Classify VTK class into pipeline role
         _get_algorithm_datatypes() Get input/output datatypes for algorithms
         _get_semantic_methods()    Get non-boilerplate methods
@@ -17,11 +18,12 @@ Code map:
 from __future__ import annotations
 
 from collections.abc import Iterable
+from typing import Any
 
 import vtk
 
 # VTK-wide infrastructure / pipeline boilerplate methods to exclude
-BOILERPLATE_METHODS = {
+BOILERPLATE_METHODS = frozenset({
     # vtkObject / vtkObjectBase
     "GetClassName", "IsA", "IsTypeOf", "NewInstance", "SafeDownCast",
     "PrintSelf", "Register", "UnRegister", "FastDelete",
@@ -40,25 +42,45 @@ BOILERPLATE_METHODS = {
     "GlobalWarningDisplayOn", "GlobalWarningDisplayOff",
     "GetGlobalWarningDisplay", "SetGlobalWarningDisplay",
     "BreakOnError",
-}
+})
 
 
-def _classify_vtk_class(class_name: str) -> str:
+def _new_instance(class_name: str) -> Any | None:
+    """Instantiate a VTK class by name.
+
+    Args:
+        class_name: Name of the VTK class.
+
+    Returns:
+        The new instance, or None if the class doesn't exist or can't be instantiated.
+    """
+    vtk_class = getattr(vtk, class_name, None)
+    if vtk_class is None:
+        return None
+
+    try:
+        return vtk_class()
+    except Exception:
+        return None
+
+
+def _classify_vtk_class(class_name: str, instance: Any | None) -> str:
     """Classify a VTK class into pipeline role using VTK introspection.
 
+    Args:
+        class_name: Name of the VTK class.
+        instance: Instance from _new_instance(), or None.
+
     Returns one of: input, filter, properties, renderer, scene, infrastructure, output, utility, color
     """
     # Color utilities (by class name)
     if class_name in ("vtkNamedColors", "vtkColorSeries"):
         return "color"
 
-    vtk_class = getattr(vtk, class_name, None)
-    if vtk_class is None:
-        return "utility"
+    if instance is None:
+        if getattr(vtk, class_name, None) is None:
+            return "utility"
 
-    try:
-        instance = vtk_class()
-    except Exception:
         # Non-instantiable algorithm base classes are filters (like vtkAlgorithm itself)
         if class_name in (
             "vtkHyperTreeGridAlgorithm",
@@ -172,19 +194,16 @@ def _classify_vtk_class(class_name: str) -> str:
     return "utility"
 
 
-def _get_algorithm_datatypes(class_name: str) -> tuple[str, str]:
+def _get_algorithm_datatypes(instance: Any | None) -> tuple[str, str]:
     """Get input and output datatypes for a vtkAlgorithm subclass.
 
+    Args:
+        instance: Instance from _new_instance(), or None.
+
     Returns:
         Tuple of (input_datatype, output_datatype). Empty strings if not applicable.
     """
-    vtk_class = getattr(vtk, class_name, None)
-    if vtk_class is None:
-        return "", ""
-
-    try:
-        instance = vtk_class()
-    except Exception:
+    if instance is None:
         return "", ""
 
     # Check if instance has IsA method
@@ -261,8 +280,10 @@ def introspect_class(class_name: str) -> dict[str, str | list[str]]:
         - output_datatype: Output data type (for algorithms)
         - semantic_methods: List of non-boilerplate methods
     """
-    role = _classify_vtk_class(class_name)
-    input_datatype, output_datatype = _get_algorithm_datatypes(class_name)
+    # Both checks inspect the same instance, so only construct it once
+    instance = _new_instance(class_name)
+    role = _classify_vtk_class(class_name, instance)
+    input_datatype, output_datatype = _get_algorithm_datatypes(instance)
     semantic_methods = _get_semantic_methods(class_name)
 
     return {
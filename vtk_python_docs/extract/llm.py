@@ -3,18 +3,29 @@
 Code map:
     check_llm_configured()         Verify LLM is configured, exit if not
     classify_class()               Classify a single VTK class (async)
+        _normalize_doc()           Collapse whitespace and truncate a class doc
+    classify_class_group()         Classify several classes in one LLM request (async)
+        _RateLimiter               Token bucket spacing out LLM requests
+        _parse_json_response()     Parse the JSON in an LLM reply
+        _clean_result()            Validate and normalize one classification
     classify_classes_batch()       Classify multiple classes with rate limiting (async)
         _load_cache()              Load cached classifications from file
+        doc_hash()                 Content hash of what the LLM is asked about
+        _save_to_cache()           Rewrite the cache file with new classifications
 """
 
 import asyncio
+import hashlib
 import json
 import os
+import time
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
 
+from .._io import json_dumps, json_loads
+
 # Load .env from project root
 _env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(_env_path)
@@ -32,25 +43,79 @@ def _load_cache() -> dict[str, dict[str, Any]]:
 
     _llm_cache = {}
     if _cache_path.exists():
-        with open(_cache_path, "r", encoding="utf-8") as f:
+        with open(_cache_path, "rb") as f:
             for line in f:
                 if line.strip():
-                    record = json.loads(line)
+                    record = json_loads(line)
+                    # Later lines win (older cache files were appended to)
                     _llm_cache[record["class_name"]] = record
     return _llm_cache
 
 
+def doc_hash(class_name: str, class_doc: str) -> str:
+    """Hash the model, prompts, class name and normalized doc sent to the LLM.
+
+    Cached classifications are only reused while this hash matches, so
+    changed docs, a changed prompt or a different model are classified
+    again. Whitespace-only edits and edits past the truncation point keep
+    the hash.
+
+    Args:
+        class_name: Name of the VTK class.
+        class_doc: Class documentation text.
+
+    Returns:
+        Hex digest identifying the classification request.
+    """
+    content = "\0".join((
+        LLM_MODEL, SYSTEM_PROMPT, CLASSIFY_PROMPT, BATCH_CLASSIFY_PROMPT, class_name, _normalize_doc(class_doc)
+    ))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
+
+def _save_to_cache(records: list[dict[str, Any]]) -> None:
+    """Add new classifications to the in-memory cache and rewrite the cache file.
+
+    The file is rewritten from the in-memory cache (one line per class) rather
+    than appended to, so replaced classifications don't pile up. It is written
+    to a temp file first and swapped in, so an interrupted run can't leave a
+    truncated cache behind.
+
+    Args:
+        records: Cache records with class_name, doc_hash and the LLM fields.
+    """
+    if not records:
+        return
+
+    cache = _load_cache()
+    for record in records:
+        cache[record["class_name"]] = record
+
+    _cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = _cache_path.with_name(_cache_path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        for record in cache.values():
+            f.write(json_dumps(record))
+            f.write(b"\n")
+    os.replace(temp_path, _cache_path)
+
+
 # Configuration from environment
 LLM_MODEL = os.getenv("LLM_MODEL", "")
 LLM_RATE_LIMIT = int(os.getenv("LLM_RATE_LIMIT", "60"))
 LLM_MAX_CONCURRENT = int(os.getenv("LLM_MAX_CONCURRENT", "10"))
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "10"))
 
+# Class docs are truncated to this many characters to avoid token limits
+_MAX_DOC_LENGTH = 2000
 
-CLASSIFY_PROMPT = """You are classifying VTK (Visualization Toolkit) classes for documentation.
+# Output token budget per classified class; a reply object is well under this
+_MAX_TOKENS_PER_CLASS = 120
 
-Given a VTK class name and its documentation, return a JSON object with these three fields:
 
-1. "synopsis": A single sentence (max 20 words) summarizing what the class does.
+_PROMPT_INTRO = "You are classifying VTK (Visualization Toolkit) classes for documentation."
+
+_PROMPT_FIELDS = """1. "synopsis": A single sentence (max 20 words) summarizing what the class does.
    - Do not start with the class name or "This class" or "A class that"
    - Start directly with what it does
 
@@ -62,15 +127,33 @@ Given a VTK class name and its documentation, return a JSON object with these th
    - 0.7: Classes for specific tasks (properties, widgets, specialized filters)
    - 0.5: Standard pipeline components often copied from examples
    - 0.3: Internal data structures rarely named by users
-   - 0.1: Infrastructure and base classes users almost never type
+   - 0.1: Infrastructure and base classes users almost never type"""
+
+# Instructions shared by every request, sent once as the system message
+# instead of being repeated in each user prompt
+SYSTEM_PROMPT = f"""{_PROMPT_INTRO}
+
+Given a VTK class name and its documentation, produce a JSON object with these three fields:
+
+{_PROMPT_FIELDS}"""
+
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
 
-Class: {class_name}
+CLASSIFY_PROMPT = """Class: {class_name}
 
 Documentation:
 {class_doc}
 
 Respond with only the JSON object, no other text:"""
 
+# Several classes per request
+BATCH_CLASSIFY_PROMPT = """Return a JSON array with one object per class, in the order given.
+Each object has a "class_name" field with the class name, plus the three fields above.
+
+{classes}
+
+Respond with only the JSON array, no other text:"""
+
 
 def check_llm_configured() -> None:
     """Check if LLM is properly configured, exit with instructions if not."""
@@ -111,6 +194,34 @@ def check_llm_configured() -> None:
         raise SystemExit(1)
 
 
+class _RateLimiter:
+    """Async token bucket allowing `rate` acquisitions per `period` seconds.
+
+    Up to `burst` tokens can accumulate while idle; once they are used,
+    callers wait only as long as it takes the next token to refill.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0, burst: int = 1):
+        self._interval = period / rate
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) / self._interval)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self._interval)
+
+
 async def classify_class(class_name: str, class_doc: str) -> dict[str, Any] | None:
     """Classify a VTK class using LLM.
 
@@ -129,22 +240,17 @@ async def classify_class(class_name: str, class_doc: str) -> dict[str, Any] | No
     try:
         import litellm
 
-        # Truncate long docs to avoid token limits
-        max_doc_length = 2000
-        if len(class_doc) > max_doc_length:
-            class_doc = class_doc[:max_doc_length] + "..."
-
         # Build prompt
         prompt = CLASSIFY_PROMPT.format(
             class_name=class_name,
-            class_doc=class_doc,
+            class_doc=_normalize_doc(class_doc),
         )
 
         response = await litellm.acompletion(
             model=LLM_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=200,
-            temperature=0.3,
+            messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            max_tokens=_MAX_TOKENS_PER_CLASS,
+            temperature=0,
         )
 
         # Extract and parse JSON response
@@ -152,31 +258,8 @@ async def classify_class(class_name: str, class_doc: str) -> dict[str, Any] | No
         if not content:
             return None
 
-        # Clean up response - remove markdown code blocks if present
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("\n", 1)[1] if "\n" in content else content[3:]
-        if content.endswith("```"):
-            content = content.rsplit("```", 1)[0]
-        content = content.strip()
-
-        result = json.loads(content)
-
-        # Validate and clean up result
-        if "synopsis" in result:
-            synopsis = result["synopsis"].strip().strip("\"'")
-            if synopsis and not synopsis.endswith("."):
-                synopsis += "."
-            result["synopsis"] = synopsis
-
-        # Validate visibility_score
-        visibility = result.pop("visibility", None) or result.get("visibility_score")
-        if isinstance(visibility, (int, float)):
-            result["visibility_score"] = max(0.0, min(1.0, float(visibility)))
-        else:
-            result["visibility_score"] = 0.3
-
-        return result
+        result = _parse_json_response(content)
+        return _clean_result(result) if isinstance(result, dict) else None
 
     except json.JSONDecodeError as e:
         print(f"⚠️  JSON parse error for {class_name}: {e}")
@@ -186,6 +269,134 @@ async def classify_class(class_name: str, class_doc: str) -> dict[str, Any] | No
         return None
 
 
+async def classify_class_group(
+    items: list[tuple[str, str]], limiter: _RateLimiter | None = None
+) -> dict[str, dict[str, Any] | None]:
+    """Classify several VTK classes with a single LLM request.
+
+    Replies are matched to classes by their class_name. Classes missing from
+    (or malformed in) the reply are classified one by one with
+    classify_class().
+
+    Args:
+        items: List of (class_name, class_doc) tuples.
+        limiter: Rate limiter to take a token from before every request,
+                 including the one-by-one retries.
+
+    Returns:
+        Dictionary mapping class_name to classification dict (None if failed).
+    """
+    items = [(name, doc) for name, doc in items if doc and doc.strip()]
+    results: dict[str, dict[str, Any] | None] = {}
+    if len(items) == 1:
+        if limiter:
+            await limiter.acquire()
+        results[items[0][0]] = await classify_class(*items[0])
+        return results
+
+    if items:
+        try:
+            import litellm
+
+            if limiter:
+                await limiter.acquire()
+
+            classes = "\n\n".join(
+                f"Class {i}: {class_name}\n\nDocumentation:\n{_normalize_doc(class_doc)}"
+                for i, (class_name, class_doc) in enumerate(items, 1)
+            )
+            response = await litellm.acompletion(
+                model=LLM_MODEL,
+                messages=[_SYSTEM_MESSAGE, {"role": "user", "content": BATCH_CLASSIFY_PROMPT.format(classes=classes)}],
+                max_tokens=_MAX_TOKENS_PER_CLASS * len(items),
+                temperature=0,
+            )
+
+            content = response.choices[0].message.content  # type: ignore
+            parsed = _parse_json_response(content) if content else []
+            if isinstance(parsed, list):
+                # Match replies by class name only; a reply that drops or
+                # misspells a name would shift positions onto the wrong class
+                names = {class_name for class_name, _ in items}
+                for result in parsed:
+                    if not isinstance(result, dict):
+                        continue
+                    class_name = result.pop("class_name", None)
+                    if class_name in names:
+                        results[class_name] = _clean_result(result)
+
+        except json.JSONDecodeError as e:
+            print(f"⚠️  JSON parse error for a group of {len(items)} classes: {e}")
+        except Exception as e:
+            print(f"⚠️  LLM error for a group of {len(items)} classes: {e}")
+
+    # Retry whatever the group reply didn't cover, one class at a time
+    for class_name, class_doc in items:
+        if results.get(class_name) is None:
+            if limiter:
+                await limiter.acquire()
+            results[class_name] = await classify_class(class_name, class_doc)
+
+    return results
+
+
+def _normalize_doc(class_doc: str) -> str:
+    """Collapse whitespace runs and truncate long docs to avoid token limits.
+
+    Anything past _MAX_DOC_LENGTH characters is never seen by the LLM.
+    """
+    class_doc = " ".join(class_doc.split())
+    if len(class_doc) > _MAX_DOC_LENGTH:
+        return class_doc[:_MAX_DOC_LENGTH] + "..."
+    return class_doc
+
+
+def _parse_json_response(content: str) -> Any:
+    """Parse the JSON in an LLM reply, ignoring markdown code fences.
+
+    Args:
+        content: Raw reply text.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the reply is not valid JSON.
+    """
+    # Clean up response - remove markdown code blocks if present
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("\n", 1)[1] if "\n" in content else content[3:]
+    if content.endswith("```"):
+        content = content.rsplit("```", 1)[0]
+    return json_loads(content.strip())
+
+
+def _clean_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Validate and normalize one classification from the LLM.
+
+    Args:
+        result: Decoded classification object.
+
+    Returns:
+        The classification with a cleaned synopsis and a clamped visibility_score.
+    """
+    if "synopsis" in result:
+        synopsis = result["synopsis"].strip().strip("\"'")
+        if synopsis and not synopsis.endswith("."):
+            synopsis += "."
+        result["synopsis"] = synopsis
+
+    # Validate visibility_score
+    visibility = result.pop("visibility", None) or result.get("visibility_score")
+    if isinstance(visibility, (int, float)):
+        result["visibility_score"] = max(0.0, min(1.0, float(visibility)))
+    else:
+        result["visibility_score"] = 0.3
+
+    return result
+
+
 async def classify_classes_batch(
     items: list[tuple[str, str]],
     max_concurrent: int | None = None,
@@ -193,7 +404,10 @@ async def classify_classes_batch(
 ) -> dict[str, dict[str, Any] | None]:
     """Classify multiple VTK classes with rate limiting.
 
-    Uses cached results when available to avoid expensive LLM calls.
+    Uses cached results when available to avoid expensive LLM calls. A cached
+    result is reused only while its doc_hash() matches, i.e. the class's doc,
+    the prompts and the model are unchanged; cache records without a
+    doc_hash are classified again. New results are saved to the cache file.
 
     Args:
         items: List of (class_name, class_doc) tuples.
@@ -209,8 +423,10 @@ async def classify_classes_batch(
 
     # Check cache first
     for class_name, class_doc in items:
-        if class_name in cache:
-            results[class_name] = cache[class_name]
+        key = doc_hash(class_name, class_doc)
+        cached = cache.get(class_name)
+        if cached and cached.get("doc_hash") == key:
+            results[class_name] = cached
         else:
             uncached_items.append((class_name, class_doc))
 
@@ -226,16 +442,35 @@ async def classify_classes_batch(
     max_concurrent = max_concurrent or LLM_MAX_CONCURRENT
     rate_limit = rate_limit or LLM_RATE_LIMIT
 
-    semaphore = asyncio.Semaphore(max_concurrent)
-    delay = 60.0 / rate_limit if rate_limit > 0 else 0
-
-    async def process_item(class_name: str, class_doc: str, index: int):
-        async with semaphore:
-            if delay > 0 and index > 0:
-                await asyncio.sleep(delay * (index % max_concurrent))
-            results[class_name] = await classify_class(class_name, class_doc)
-
-    tasks = [process_item(name, doc, i) for i, (name, doc) in enumerate(uncached_items)]
-    await asyncio.gather(*tasks, return_exceptions=True)
+    limiter = _RateLimiter(rate_limit, 60.0, burst=max_concurrent) if rate_limit > 0 else None
+
+    # Queue groups of LLM_BATCH_SIZE classes, one request each
+    queue: asyncio.Queue[list[tuple[str, str]]] = asyncio.Queue()
+    for i in range(0, len(uncached_items), LLM_BATCH_SIZE):
+        queue.put_nowait(uncached_items[i : i + LLM_BATCH_SIZE])
+
+    # A fixed pool of max_concurrent workers bounds concurrency
+    async def worker():
+        while not queue.empty():
+            group = queue.get_nowait()
+            try:
+                results.update(await classify_class_group(group, limiter))
+            except Exception as e:
+                print(f"⚠️  LLM error for a group of {len(group)} classes: {e}")
+
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrent, queue.qsize()))))
+
+    # Persist successful classifications so unchanged classes skip the LLM next time
+    _save_to_cache([
+        {
+            "class_name": class_name,
+            "doc_hash": doc_hash(class_name, class_doc),
+            "synopsis": result.get("synopsis", ""),
+            "action_phrase": result.get("action_phrase", ""),
+            "visibility_score": result.get("visibility_score", 0.3),
+        }
+        for class_name, class_doc in uncached_items
+        if (result := results.get(class_name))
+    ])
 
     return results
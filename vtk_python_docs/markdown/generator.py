@@ -4,27 +4,56 @@ Code map:
     generate_all()                 Main entry point, orchestrates full pipeline
         _load_docs_by_module()     Load JSONL and group by module
         _process_modules()         Write markdown files for all modules
-            _create_class_markdown()   Generate markdown for a single class
-                _create_metadata_table()   Create metadata table (role, action, visibility, datatypes)
-                _format_method_doc()       Format method documentation
-            _create_module_index()     Generate module index page
+            _get_markdown_docs()       Reduce module docs to what the pages show
+            _process_module()          Write one module's markdown files (worker process)
+                _create_class_markdown()   Generate markdown for a single class
+                    _create_metadata_table()   Create metadata table (role, action, visibility, datatypes)
+                    _format_method_doc()       Format method documentation
+                _create_module_index()     Generate module index page
         _create_main_index()       Generate main documentation index
             _get_vtk_version()     Get VTK version string
 """
 
-import json
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from .._io import json_loads, write_if_changed
+from .._workers import get_worker_context
 from ..config import Config, get_config
 
-
-def generate_all(config: Config | None = None) -> int:
+# Placeholder for methods without usable documentation
+_NO_DOC = "*No documentation available.*"
+
+# Class record fields shown on the markdown pages (see _get_markdown_docs)
+_MARKDOWN_FIELDS = (
+    "synopsis",
+    "class_doc",
+    "semantic_methods",
+    "role",
+    "action_phrase",
+    "visibility_score",
+    "input_datatype",
+    "output_datatype",
+)
+
+
+def generate_all(
+    config: Config | None = None,
+    docs_by_module: dict[str, dict[str, dict[str, Any]]] | None = None,
+    max_workers: int | None = None,
+) -> int:
     """Generate markdown documentation for all VTK modules.
 
     Args:
         config: Configuration instance. Uses default if not provided.
+        docs_by_module: Documentation grouped by module. Loaded from the
+                        JSONL database if not provided.
+        max_workers: Maximum number of worker processes for writing modules.
+                     Defaults to the number of CPUs.
 
     Returns:
         Number of successfully processed modules.
@@ -36,25 +65,26 @@ def generate_all(config: Config | None = None) -> int:
     print("🚀 VTK Markdown Documentation Generator")
     print("=" * 50)
 
-    # Load documentation from JSONL
-    docs_by_module = _load_docs_by_module(jsonl_file)
+    # Load documentation from JSONL (unless the caller already has it)
+    if docs_by_module is None:
+        docs_by_module = _load_docs_by_module(jsonl_file)
     if not docs_by_module:
         return 0
 
-    # rocess each module
-    results = _process_modules(docs_by_module, output_dir)
+    # Process each module
+    results = _process_modules(docs_by_module, output_dir, max_workers)
+    successful = [r for r in results if r["status"] == "success"]
+    total_classes = sum(r["class_count"] for r in successful)
 
     # Create main index
-    _create_main_index(output_dir, results)
+    _create_main_index(output_dir, successful, total_classes)
 
     # Summary
-    successful = sum(1 for r in results if r["status"] == "success")
-    total_classes = sum(r["class_count"] for r in results)
     print()
-    print(f"✅ Generated documentation for {successful}/{len(docs_by_module)} modules")
+    print(f"✅ Generated documentation for {len(successful)}/{len(docs_by_module)} modules")
     print(f"📚 Total classes: {total_classes:,}")
 
-    return successful
+    return len(successful)
 
 def _load_docs_by_module(jsonl_file: Path) -> dict[str, dict[str, dict[str, Any]]]:
     """Load documentation from JSONL, grouped by module.
@@ -72,9 +102,10 @@ def _load_docs_by_module(jsonl_file: Path) -> dict[str, dict[str, dict[str, Any]
     print("📖 Loading documentation from JSONL...")
     docs_by_module: dict[str, dict[str, dict[str, Any]]] = {}
 
-    with open(jsonl_file, "r", encoding="utf-8") as f:
+    # Parse raw bytes: both orjson and json decode UTF-8 themselves
+    with open(jsonl_file, "rb") as f:
         for line in f:
-            record = json.loads(line)
+            record = json_loads(line)
 
             # Group by module, then by class
             module_name = record.get("module_name", "unknown")
@@ -87,51 +118,116 @@ def _load_docs_by_module(jsonl_file: Path) -> dict[str, dict[str, dict[str, Any]
     return docs_by_module
 
 def _process_modules(
-    docs_by_module: dict[str, dict[str, dict[str, Any]]], output_dir: Path
+    docs_by_module: dict[str, dict[str, dict[str, Any]]], output_dir: Path, max_workers: int | None = None
 ) -> list[dict[str, Any]]:
     """Process all modules and write markdown files.
 
     Args:
         docs_by_module: Documentation grouped by module.
         output_dir: Directory to write markdown files.
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
 
     Returns:
         List of processing results per module.
     """
-    # Clean and create output directory
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
+    # Update the output directory in place: unchanged pages are not rewritten.
+    # Module directories are created up front, so workers only write files.
     output_dir.mkdir(parents=True, exist_ok=True)
+    for module_name, module_docs in docs_by_module.items():
+        if module_docs:
+            (output_dir / module_name).mkdir(exist_ok=True)
+
+    # Rendering markdown is CPU-bound string work, so use processes rather than
+    # threads, largest modules first so none is left straggling. Workers only
+    # receive the fields and key methods the pages show, which keeps pickling
+    # cheap.
+    modules = sorted(docs_by_module, key=lambda m: len(docs_by_module[m]), reverse=True)
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(modules)))
+    results_by_module = {}
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_worker_context()) as executor:
+        futures = [
+            executor.submit(_process_module, module_name, _get_markdown_docs(docs_by_module[module_name]), output_dir)
+            for module_name in modules
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results_by_module[result["module"]] = result
+            if result["status"] == "success":
+                print(f"✅ {result['module']}: {result['class_count']} classes")
+            elif result["status"] == "error":
+                print(f"❌ {result['module']}: {result['error']}")
+
+    # Remove pages of modules that are no longer documented
+    for stale_dir in output_dir.iterdir():
+        if stale_dir.is_dir() and stale_dir.name not in docs_by_module:
+            shutil.rmtree(stale_dir)
+
+    # Report results in the JSONL's canonical module order
+    return [results_by_module[module_name] for module_name in docs_by_module]
+
+def _get_markdown_docs(module_docs: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Reduce a module's documentation to the data used by its markdown pages.
+
+    Args:
+        module_docs: {class_name: class_data} for this module.
 
-    results = []
+    Returns:
+        {class_name: class_data} keeping only the displayed fields, with
+        method sections filtered to the class's key (semantic) methods.
+    """
+    markdown_docs = {}
+    for class_name, class_data in module_docs.items():
+        semantic_methods_set = set(class_data.get("semantic_methods", []))
+        # Sections are kept even without key methods, since any section
+        # makes the page list a "Methods" heading
+        sections = {
+            section_name: {
+                "methods": {k: v for k, v in section_data.get("methods", {}).items() if k in semantic_methods_set}
+            }
+            for section_name, section_data in class_data.get("structured_docs", {}).get("sections", {}).items()
+        }
+
+        markdown_docs[class_name] = {
+            field: class_data[field] for field in _MARKDOWN_FIELDS if field in class_data
+        }
+        markdown_docs[class_name]["structured_docs"] = {"sections": sections}
+    return markdown_docs
+
+def _process_module(module_name: str, module_docs: dict[str, dict[str, Any]], output_dir: Path) -> dict[str, Any]:
+    """Write the class pages and index of one module.
 
-    for module_name, module_docs in docs_by_module.items():
-        if not module_docs:
-            results.append({"module": module_name, "status": "empty", "class_count": 0})
-            continue
+    Args:
+        module_name: Name of the module.
+        module_docs: {class_name: class_data} for this module.
+        output_dir: Root output directory, already holding the module's directory.
+
+    Returns:
+        Processing result for the module.
+    """
+    if not module_docs:
+        return {"module": module_name, "status": "empty", "class_count": 0}
 
-        try:
-            # Create module directory
-            module_dir = output_dir / module_name
-            module_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        module_dir = output_dir / module_name
 
-            # Write class markdown files
-            for class_name, class_data in module_docs.items():
-                markdown = _create_class_markdown(class_name, class_data, module_name)
-                (module_dir / f"{class_name}.md").write_text(markdown, encoding="utf-8")
+        # Write class markdown files
+        for class_name, class_data in module_docs.items():
+            markdown = _create_class_markdown(class_name, class_data, module_name)
+            write_if_changed(module_dir / f"{class_name}.md", markdown.encode("utf-8"))
 
-            # Write module index
-            index_content = _create_module_index(module_name, module_docs)
-            (module_dir / "index.md").write_text(index_content, encoding="utf-8")
+        # Write module index
+        index_content = _create_module_index(module_name, module_docs)
+        write_if_changed(module_dir / "index.md", index_content.encode("utf-8"))
 
-            results.append({"module": module_name, "status": "success", "class_count": len(module_docs)})
-            print(f"✅ {module_name}: {len(module_docs)} classes")
+        # Remove pages of classes that are no longer documented
+        for stale_file in module_dir.glob("*.md"):
+            if stale_file.stem not in module_docs and stale_file.name != "index.md":
+                stale_file.unlink()
 
-        except Exception as e:
-            results.append({"module": module_name, "status": "error", "error": str(e), "class_count": 0})
-            print(f"❌ {module_name}: {e}")
+        return {"module": module_name, "status": "success", "class_count": len(module_docs)}
 
-    return results
+    except Exception as e:
+        return {"module": module_name, "status": "error", "error": str(e), "class_count": 0}
 
 def _create_class_markdown(class_name: str, class_data: dict[str, Any], module_name: str) -> str:
     """Create markdown content for a single class.
@@ -186,8 +282,9 @@ def _create_class_markdown(class_name: str, class_data: dict[str, Any], module_n
                 clean_section = section_name.replace("|", "").strip()
                 lines.extend([f"### {clean_section}", ""])
 
-                for method_name, method_doc in sorted(key_methods.items()):
-                    lines.extend([f"#### `{method_name}`", "", _format_method_doc(method_doc), ""])
+                # Sort by name only; the (large) docs never take part in comparisons
+                for method_name in sorted(key_methods):
+                    lines.extend([f"#### `{method_name}`", "", _format_method_doc(key_methods[method_name]), ""])
 
     return "\n".join(lines)
 
@@ -211,8 +308,8 @@ def _create_module_index(module_name: str, module_docs: dict[str, dict[str, Any]
         "",
     ]
 
-    for class_name in sorted(module_docs.keys()):
-        synopsis = module_docs[class_name].get("synopsis", "")
+    for class_name, class_data in sorted(module_docs.items()):
+        synopsis = class_data.get("synopsis", "")
         entry = f"- [`{class_name}`]({class_name}.md)"
         if synopsis:
             entry += f" - {synopsis}"
@@ -220,16 +317,14 @@ def _create_module_index(module_name: str, module_docs: dict[str, dict[str, Any]
 
     return "\n".join(lines)
 
-def _create_main_index(output_dir: Path, results: list[dict[str, Any]]) -> None:
+def _create_main_index(output_dir: Path, successful: list[dict[str, Any]], total_classes: int) -> None:
     """Create main documentation index.
 
     Args:
         output_dir: Root output directory.
-        results: List of processing results per module.
+        successful: Processing results of the successfully written modules.
+        total_classes: Number of classes across those modules.
     """
-    successful = [r for r in results if r["status"] == "success"]
-    total_classes = sum(r["class_count"] for r in successful)
-
     lines = [
         "# VTK Python API Documentation",
         "",
@@ -246,7 +341,7 @@ def _create_main_index(output_dir: Path, results: list[dict[str, Any]]) -> None:
         count = result["class_count"]
         lines.append(f"- [{module}]({module}/index.md) ({count} classes)")
 
-    (output_dir / "index.md").write_text("\n".join(lines), encoding="utf-8")
+    write_if_changed(output_dir / "index.md", "\n".join(lines).encode("utf-8"))
 
 def _create_metadata_table(class_data: dict[str, Any]) -> list[str]:
     """Create metadata table for class page.
@@ -287,6 +382,9 @@ def _create_metadata_table(class_data: dict[str, Any]) -> list[str]:
     return []
 
 
+# Inherited methods repeat the same docs across classes (only about one in
+# eight formatted docs is unique), so formatting is memoized
+@lru_cache(maxsize=65536)
 def _format_method_doc(method_doc: str) -> str:
     """Format method documentation for markdown, filtering C++ artifacts.
 
@@ -297,23 +395,24 @@ def _format_method_doc(method_doc: str) -> str:
         Cleaned documentation string.
     """
     if not method_doc or method_doc.strip() == ".":
-        return "*No documentation available.*"
+        return _NO_DOC
 
+    # Strip each line once; blank lines are dropped along with C++ artifacts
     lines = [
-        line.strip()
-        for line in method_doc.strip().split("\n")
-        if line.strip()
-        and not line.strip().startswith("C++:")
-        and "::" not in line
-        and not line.strip().startswith("---")  # Filter VTK help() separators
+        stripped
+        for stripped in (line.strip() for line in method_doc.split("\n"))
+        if stripped
+        and not stripped.startswith(("C++:", "---"))  # "---": VTK help() separators
+        and "::" not in stripped
     ]
 
-    return "\n".join(lines) if lines else "*No documentation available.*"
+    return "\n".join(lines) if lines else _NO_DOC
 
 def _get_vtk_version() -> str:
     """Get VTK version string."""
     try:
-        import vtk
-        return f"VTK {vtk.vtkVersion.GetVTKVersion()}"
+        # vtkCommonCore alone is enough; "import vtk" loads every VTK module
+        from vtkmodules.vtkCommonCore import vtkVersion
+        return f"VTK {vtkVersion.GetVTKVersion()}"
     except ImportError:
         return "VTK (version unknown)"
@@ -1,5 +1,5 @@
 """VTK stub generation and enhancement module."""
 
-from .enhance import generate_all
+from .enhance import generate_all, generate_official_stubs, vtk_version_changed
 
-__all__ = ["generate_all"]
+__all__ = ["generate_all", "generate_official_stubs", "vtk_version_changed"]
@@ -2,29 +2,72 @@
 
 Code map:
     generate_all()                 Main entry point, orchestrates full pipeline
-        _generate_official_stubs() Generate official VTK stubs to temp directory
+        _is_up_to_date()           Check the build stamp against the JSONL, VTK and enhancer
+            _stamp_text()          Describe the installed VTK version and enhancer
+                _get_vtk_version() Get the installed VTK version
+        generate_official_stubs()  Generate official VTK stubs to temp directory
+            _wait_for_process()    Wait for the generator (timeout, cancellation)
+            _read_tail()           Read the end of the generator's stderr
         _load_docs_by_module()     Load JSONL and group by module
         _enhance_stubs()           Enhance stubs with documentation
+            _get_class_docs()      Reduce module docs to class docstrings
+            _enhance_stub_file()   Enhance a single module's stub file (worker process)
+        _write_stamp()             Record a complete build
+    vtk_version_changed()          Check whether the stubs were built for another VTK
 """
 
-import json
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import metadata
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
+from .._io import copy_if_changed, json_loads, write_if_changed
+from .._workers import get_worker_context
 from ..config import Config, get_config
 
+# Class header such as "class vtkActor(vtkProp):\n" (plus trailing blank lines)
+_CLASS_DEF_RE = re.compile(r"class (\w+)\b[^:]*:\s*\n")
 
-def generate_all(config: Config | None = None, timeout: int = 300) -> int:
+# Optional whitespace followed by an opening docstring quote
+_DOCSTRING_START_RE = re.compile(r"\s*(?:\"\"\"|''')")
+
+# Written to the output directory after a complete build; holds the VTK version
+# and the mtime of this module
+_STAMP_FILE = ".build-stamp"
+
+
+def generate_all(
+    config: Config | None = None,
+    timeout: int = 300,
+    docs_by_module: dict[str, dict[str, dict[str, Any]]] | None = None,
+    max_workers: int | None = None,
+    force: bool = False,
+    stubs_dir: Path | None = None,
+) -> int:
     """Generate official VTK stubs and enhance them with documentation.
 
+    Generation is skipped if the enhanced stubs were built after the JSONL
+    database was last written, with the same VTK version and enhancer code.
+
     Args:
         config: Configuration instance. Uses default if not provided.
         timeout: Maximum time for stub generation.
+        docs_by_module: Documentation grouped by module. Loaded from the
+                        JSONL database if not provided.
+        max_workers: Maximum number of worker processes for enhancement.
+                     Defaults to the number of CPUs.
+        force: Regenerate even if the enhanced stubs are up to date.
+        stubs_dir: Official VTK stubs generated ahead of time. Generated into
+                   a temp directory if not provided. The caller owns this
+                   directory and is responsible for removing it.
 
     Returns:
         Number of successfully enhanced stub files.
@@ -36,32 +79,105 @@ def generate_all(config: Config | None = None, timeout: int = 300) -> int:
     print("🔧 VTK Stub Generator & Enhancer")
     print("=" * 50)
 
-    # Generate official stubs to temp directory
-    temp_dir = _generate_official_stubs(timeout)
-    if not temp_dir:
+    if not force and _is_up_to_date(jsonl_file, output_dir):
+        print("✅ Enhanced stubs are up to date (use --force to regenerate)")
+        return sum(1 for _ in output_dir.glob("*.pyi"))
+
+    # Generate official stubs to temp directory (unless the caller already has them)
+    temp_dir = None if stubs_dir else generate_official_stubs(timeout)
+    stubs_dir = stubs_dir or temp_dir
+    if not stubs_dir:
         return 0
 
     try:
-        # Load documentation from JSONL
-        docs_by_module = _load_docs_by_module(jsonl_file)
+        # Load documentation from JSONL (unless the caller already has it)
+        if docs_by_module is None:
+            docs_by_module = _load_docs_by_module(jsonl_file)
         if not docs_by_module:
             return 0
 
         # Enhance stubs with documentation
-        return _enhance_stubs(temp_dir, docs_by_module, output_dir)
+        successful = _enhance_stubs(stubs_dir, docs_by_module, output_dir, max_workers)
+        if successful == sum(1 for _ in stubs_dir.glob("*.pyi")):
+            _write_stamp(output_dir)
+        return successful
     finally:
         # Clean up temp directory
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+def _is_up_to_date(jsonl_file: Path, output_dir: Path) -> bool:
+    """Check whether the enhanced stubs are newer than their inputs.
+
+    Args:
+        jsonl_file: Path to the JSONL database the stubs are built from.
+        output_dir: Directory holding the enhanced stubs.
+
+    Returns:
+        True if the build stamp is newer than the JSONL and records the
+        installed VTK version and the current enhancer.
+    """
+    stamp = output_dir / _STAMP_FILE
+    try:
+        if stamp.stat().st_mtime < jsonl_file.stat().st_mtime:
+            return False
+        return stamp.read_text(encoding="utf-8") == _stamp_text()
+    except FileNotFoundError:
+        return False
+
+def vtk_version_changed(output_dir: Path) -> bool:
+    """Check whether the enhanced stubs were built for a different VTK version.
+
+    The official stubs depend only on the installed VTK, so when this is
+    True the next generate_all() is certain to need them, whatever the JSONL
+    holds.
+
+    Args:
+        output_dir: Directory holding the enhanced stubs.
+
+    Returns:
+        True if there is no build stamp or it records another VTK version.
+    """
+    try:
+        stamp = (output_dir / _STAMP_FILE).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return True
+    return stamp.split("\n", 1)[0] != _get_vtk_version()
+
+def _write_stamp(output_dir: Path) -> None:
+    """Record a complete build in the output directory.
+
+    Args:
+        output_dir: Directory holding the enhanced stubs.
+    """
+    (output_dir / _STAMP_FILE).write_text(_stamp_text(), encoding="utf-8")
+
+def _stamp_text() -> str:
+    """Describe what a build depends on besides the JSONL.
+
+    Returns:
+        The installed VTK version and this module's mtime, one per line, so
+        upgrading VTK or changing the enhancer invalidates the stamp.
+    """
+    return f"{_get_vtk_version()}\n{Path(__file__).stat().st_mtime_ns}"
+
+def _get_vtk_version() -> str:
+    """Get the installed VTK version without importing VTK."""
+    try:
+        return metadata.version("vtk")
+    except metadata.PackageNotFoundError:
+        return ""
 
-def _generate_official_stubs(timeout: int = 300) -> Path | None:
+def generate_official_stubs(timeout: int = 300, cancel: threading.Event | None = None) -> Path | None:
     """Generate official VTK stub files to a temporary directory.
 
     Args:
         timeout: Maximum time in seconds for generation.
+        cancel: Event that stops the generator early when set (e.g. because
+                the build it runs alongside failed).
 
     Returns:
-        Path to temp directory with stubs, or None on failure.
+        Path to temp directory with stubs, or None on failure or cancellation.
     """
     print("📦 Generating official VTK stub files...")
 
@@ -70,27 +186,78 @@ def _generate_official_stubs(timeout: int = 300) -> Path | None:
 
     try:
         # Run VTK's built-in stub generator
+        # Stdout is unused and stderr is only needed on failure, so spool it
+        # to a file instead of buffering the child's output in memory
         cmd = [sys.executable, "-m", "vtkmodules.generate_pyi", "-o", str(temp_dir)]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-
-        if result.returncode == 0:
-            pyi_files = list(temp_dir.rglob("*.pyi"))
-            print(f"   Generated {len(pyi_files)} stub files")
-            return temp_dir
-        else:
-            print(f"❌ VTK stub generation failed: {result.stderr}")
-            shutil.rmtree(temp_dir)
-            return None
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr_file) as process:
+                returncode = _wait_for_process(process, timeout, cancel)
+            if returncode is None:
+                print("⏹️  VTK stub generation cancelled")
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return None
+            if returncode == 0:
+                pyi_count = sum(1 for _ in temp_dir.rglob("*.pyi"))
+                print(f"   Generated {pyi_count} stub files")
+                return temp_dir
+            stderr_tail = _read_tail(stderr_file)
+
+        print(f"❌ VTK stub generation failed: {stderr_tail}")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return None
 
     except subprocess.TimeoutExpired:
         print(f"❌ VTK stub generation timed out after {timeout}s")
-        shutil.rmtree(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
         return None
     except Exception as e:
         print(f"❌ VTK stub generation failed: {e}")
-        shutil.rmtree(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
         return None
 
+def _wait_for_process(process: subprocess.Popen, timeout: float, cancel: threading.Event | None) -> int | None:
+    """Wait for a child process, killing it on timeout or cancellation.
+
+    Args:
+        process: Running child process.
+        timeout: Maximum time in seconds to wait.
+        cancel: Event that stops the wait (and the child) when set.
+
+    Returns:
+        The child's return code, or None if it was cancelled.
+
+    Raises:
+        subprocess.TimeoutExpired: If the child ran longer than timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        # Poll in short slices so a cancellation is noticed promptly
+        remaining = deadline - time.monotonic()
+        try:
+            return process.wait(timeout=max(0.0, min(0.2, remaining)))
+        except subprocess.TimeoutExpired:
+            if cancel is not None and cancel.is_set():
+                process.kill()
+                process.wait()
+                return None
+            if remaining <= 0:
+                process.kill()
+                process.wait()
+                raise
+
+def _read_tail(file: IO[bytes], size: int = 4096) -> str:
+    """Read the last bytes of an open binary file as text.
+
+    Args:
+        file: Open binary file.
+        size: Maximum number of bytes to read from the end.
+
+    Returns:
+        Decoded tail of the file.
+    """
+    file.seek(max(0, file.seek(0, os.SEEK_END) - size))
+    return file.read().decode("utf-8", errors="replace")
+
 def _load_docs_by_module(jsonl_file: Path) -> dict[str, dict[str, dict[str, Any]]]:
     """Load documentation from JSONL, grouped by module.
 
@@ -107,9 +274,10 @@ def _load_docs_by_module(jsonl_file: Path) -> dict[str, dict[str, dict[str, Any]
     print("📖 Loading documentation from JSONL...")
     docs_by_module: dict[str, dict[str, dict[str, Any]]] = {}
 
-    with open(jsonl_file, "r", encoding="utf-8") as f:
+    # Parse raw bytes: both orjson and json decode UTF-8 themselves
+    with open(jsonl_file, "rb") as f:
         for line in f:
-            record = json.loads(line)
+            record = json_loads(line)
 
             # Group by module, then by class
             module_name = record.get("module_name", "unknown")
@@ -122,7 +290,10 @@ def _load_docs_by_module(jsonl_file: Path) -> dict[str, dict[str, dict[str, Any]
     return docs_by_module
 
 def _enhance_stubs(
-    stubs_dir: Path, docs_by_module: dict[str, dict[str, dict[str, Any]]], output_dir: Path
+    stubs_dir: Path,
+    docs_by_module: dict[str, dict[str, dict[str, Any]]],
+    output_dir: Path,
+    max_workers: int | None = None,
 ) -> int:
     """Enhance all stub files with documentation.
 
@@ -130,66 +301,117 @@ def _enhance_stubs(
         stubs_dir: Directory containing official VTK stubs.
         docs_by_module: Documentation grouped by module.
         output_dir: Directory to write enhanced stubs.
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
 
     Returns:
         Number of successfully enhanced stub files.
     """
     print("✨ Enhancing stubs with documentation...")
 
-    # Clean and create output directory
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
+    # Update the output directory in place: unchanged stubs are not rewritten
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Copy py.typed marker
     py_typed = stubs_dir / "py.typed"
     if py_typed.exists():
-        shutil.copy(py_typed, output_dir / "py.typed")
-
-    # Process each stub file
-    stub_files = list(stubs_dir.glob("*.pyi"))
-    successful = 0
+        copy_if_changed(py_typed, output_dir / "py.typed")
+
+    # Process stub files in parallel (each module is independent), largest
+    # files first so a big module started last doesn't become a straggler.
+    # Idle workers pull the next file, so this is greedy LPT scheduling
+    # without packing fixed bins up front
+    stub_files = sorted(stubs_dir.glob("*.pyi"), key=lambda f: f.stat().st_size, reverse=True)
+
+    # Enhancement is CPU-bound regex/string work, so use processes rather than
+    # threads. Workers only receive {class_name: class_doc} for their module,
+    # which keeps pickling cheap.
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(stub_files)))
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_worker_context()) as executor:
+        futures = [
+            executor.submit(
+                _enhance_stub_file,
+                stub_file,
+                _get_class_docs(docs_by_module.get(stub_file.stem, {})),
+                output_dir / stub_file.name,
+            )
+            for stub_file in stub_files
+        ]
+        successful = sum(1 for future in as_completed(futures) if future.result())
+
+    # Remove stubs for modules that are no longer generated
+    stub_names = {stub_file.name for stub_file in stub_files}
+    for stale_file in output_dir.glob("*.pyi"):
+        if stale_file.name not in stub_names:
+            stale_file.unlink()
 
-    for stub_file in stub_files:
-        module_name = stub_file.stem
-        module_docs = docs_by_module.get(module_name, {})
-        output_file = output_dir / stub_file.name
+    print(f"✅ Enhanced {successful}/{len(stub_files)} stub files")
+    return successful
 
-        # No docs available, just copy the original
-        if not module_docs:
-            shutil.copy(stub_file, output_file)
-            successful += 1
-            continue
+def _get_class_docs(module_docs: dict[str, dict[str, Any]]) -> dict[str, str]:
+    """Reduce a module's documentation to the class docstrings used in stubs.
 
-        try:
-            content = stub_file.read_text(encoding="utf-8")
+    Args:
+        module_docs: {class_name: class_data} for this module.
 
-            # Add docstrings to class definitions
-            for class_name, class_data in module_docs.items():
-                class_desc = class_data.get("class_doc")
-                if not class_desc:
-                    continue
+    Returns:
+        Dictionary mapping class names to non-empty class documentation.
+    """
+    return {
+        class_name: class_doc
+        for class_name, class_data in module_docs.items()
+        if (class_doc := class_data.get("class_doc"))
+    }
 
-                # Match "class vtkActor(vtkProp):\n" pattern
-                class_pattern = rf"(class {re.escape(class_name)}\b[^:]*:)\s*\n"
-                match = re.search(class_pattern, content)
-                if not match:
-                    continue
+def _enhance_stub_file(stub_file: Path, class_docs: dict[str, str], output_file: Path) -> bool:
+    """Enhance a single stub file with class documentation.
 
-                # Skip if docstring already exists
-                after_class = content[match.end():]
-                if after_class.strip().startswith('"""') or after_class.strip().startswith("'''"):
-                    continue
+    Args:
+        stub_file: Official VTK stub file for one module.
+        class_docs: {class_name: class_doc} for this module.
+        output_file: Path to write the enhanced stub file.
 
-                # Insert docstring after class definition line
-                docstring = f'    """{class_desc}"""\n'
-                content = content[:match.end()] + docstring + content[match.end():]
+    Returns:
+        True if the stub file was written, False on error.
+    """
+    # No docs available, just copy the original
+    if not class_docs:
+        copy_if_changed(stub_file, output_file)
+        return True
 
-            output_file.write_text(content, encoding="utf-8")
-            successful += 1
+    try:
+        # Read raw bytes and decode once, skipping the text-mode wrapper
+        raw = stub_file.read_bytes()
+        content = raw.decode("utf-8")
+
+        # Scan the class headers once, splicing each docstring in after the
+        # first header for that class, and join the fragments at the end
+        remaining = dict(class_docs)
+        parts: list[str] = []
+        position = 0
+        for match in _CLASS_DEF_RE.finditer(content):
+            class_desc = remaining.pop(match.group(1), None)
+            if class_desc is None:
+                continue
+
+            # Skip if docstring already exists (peek past the whitespace instead
+            # of copying the rest of the file for every class)
+            if _DOCSTRING_START_RE.match(content, match.end()):
+                continue
+
+            parts.append(content[position:match.end()])
+            parts.append(f'    """{class_desc}"""\n')
+            position = match.end()
+
+        # Nothing inserted: write the original bytes back without re-encoding
+        if not parts:
+            write_if_changed(output_file, raw)
+            return True
+
+        parts.append(content[position:])
+        write_if_changed(output_file, "".join(parts).encode("utf-8"))
+        return True
 
-        except Exception as e:
-            print(f"❌ Error enhancing {stub_file.name}: {e}")
+    except Exception as e:
+        print(f"❌ Error enhancing {stub_file.name}: {e}")
+        return False
 
-    print(f"✅ Enhanced {successful}/{len(stub_files)} stub files")
-    return successful